@@ -248,6 +248,10 @@ def run_pipeline(source_url: str) -> str:
             metadata={'error': str(e)}
         )
         raise
+    
+    finally:
+        # Persist any buffered audit events for this run
+        db.flush_audit_log()
 
 
 def get_pipeline_outputs(pipeline_id: str) -> Dict[int, Dict[str, Any]]:
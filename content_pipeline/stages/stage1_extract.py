@@ -5,10 +5,14 @@ Extracts clean content from competitor URLs using Jina AI Reader and Trafilatura
 import os
 import requests
 import trafilatura
+from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+EXTRACTIONS_DIR = os.path.join(BASE_DIR, 'data', 'extractions')
+
 load_dotenv()
 
 
@@ -208,17 +212,11 @@ def save_extraction(content: Dict[str, Any], extraction_id: str) -> None:
         content: Extracted content dictionary
         extraction_id: Unique ID for this extraction
     """
-    output_dir = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)), 
-        'data', 
-        'extractions'
-    )
-    os.makedirs(output_dir, exist_ok=True)
+    Path(EXTRACTIONS_DIR).mkdir(parents=True, exist_ok=True)
     
     # Save markdown content
-    content_file = os.path.join(output_dir, f"{extraction_id}.md")
-    with open(content_file, 'w', encoding='utf-8') as f:
-        f.write(content['content'])
+    content_file = os.path.join(EXTRACTIONS_DIR, f"{extraction_id}.md")
+    Path(content_file).write_text(content['content'], encoding='utf-8')
     
     print(f"Saved extraction to {content_file}")
 
@@ -9,17 +9,16 @@ from typing import Dict, Any, List
 from dotenv import load_dotenv
 from utils.llm_client import call_with_structured_output, call_gemini
 
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+PROMPTS_PATH = os.path.join(BASE_DIR, 'config', 'prompts.yaml')
+EXTRACTIONS_DIR = os.path.join(BASE_DIR, 'data', 'extractions')
+
 load_dotenv()
 
 
 def load_prompts() -> Dict[str, Any]:
     """Load prompts from configuration"""
-    config_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'config',
-        'prompts.yaml'
-    )
-    with open(config_path, 'r') as f:
+    with open(PROMPTS_PATH, 'r') as f:
         return yaml.safe_load(f)
 
 
@@ -261,12 +260,7 @@ def run(pipeline_id: str, extraction_output: Dict[str, Any]) -> Dict[str, Any]:
     """
     try:
         # Load the full content from extraction
-        content_file = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'data',
-            'extractions',
-            f"{pipeline_id}.md"
-        )
+        content_file = os.path.join(EXTRACTIONS_DIR, f"{pipeline_id}.md")
         
         with open(content_file, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -7,20 +7,12 @@ import yaml
 import numpy as np
 from typing import Dict, Any, List
 from urllib.parse import urlparse
-from sentence_transformers import SentenceTransformer
+from stages.stage4_rag_setup import get_embedding_model
 
-
-# Global model instance
-_embedding_model = None
-
-
-def get_embedding_model():
-    """Get or create embedding model instance"""
-    global _embedding_model
-    if _embedding_model is None:
-        print("Loading sentence transformer model...")
-        _embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-    return _embedding_model
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+BRAND_GUIDELINES_PATH = os.path.join(BASE_DIR, 'config', 'brand_guidelines.yaml')
+FINGERPRINTS_DIR = os.path.join(BASE_DIR, 'data', 'fingerprints')
+EXTRACTIONS_DIR = os.path.join(BASE_DIR, 'data', 'extractions')
 
 
 def chunk_content(content: str, chunk_size: int = 500) -> List[str]:
@@ -63,7 +55,12 @@ def generate_content_fingerprint(content: str) -> np.ndarray:
     if not chunks:
         return np.array([])
     
-    embeddings = model.encode(chunks)
+    embeddings = model.encode(
+        chunks,
+        batch_size=len(chunks),
+        normalize_embeddings=True,
+        show_progress_bar=False
+    )
     
     print(f"✓ Generated {len(embeddings)} chunk embeddings")
     
@@ -84,13 +81,7 @@ def assess_copyright_risk(source_url: str, content: str) -> str:
     print("Assessing copyright risk...")
     
     # Load brand guidelines with risk sources
-    config_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'config',
-        'brand_guidelines.yaml'
-    )
-    
-    with open(config_path, 'r') as f:
+    with open(BRAND_GUIDELINES_PATH, 'r') as f:
         guidelines = yaml.safe_load(f)
     
     domain = urlparse(source_url).netloc.lower()
@@ -212,15 +203,12 @@ def save_fingerprint(pipeline_id: str, fingerprint: np.ndarray) -> None:
         pipeline_id: Unique pipeline identifier
         fingerprint: Embedding array
     """
-    output_dir = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'data',
-        'fingerprints'
-    )
-    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(FINGERPRINTS_DIR, exist_ok=True)
     
-    fingerprint_file = os.path.join(output_dir, f"{pipeline_id}.npy")
-    np.save(fingerprint_file, fingerprint)
+    fingerprint_file = os.path.join(FINGERPRINTS_DIR, f"{pipeline_id}.npy")
+    # float16 halves the file and the bytes moved in Stage 7; precision is ample
+    # for comparing unit-length embeddings against a 0.85 similarity threshold
+    np.save(fingerprint_file, np.asarray(fingerprint, dtype=np.float16))
     
     print(f"Saved content fingerprint to {fingerprint_file}")
 
@@ -238,12 +226,7 @@ def run(pipeline_id: str, extraction_output: Dict[str, Any]) -> Dict[str, Any]:
     """
     try:
         # Load the full content
-        content_file = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'data',
-            'extractions',
-            f"{pipeline_id}.md"
-        )
+        content_file = os.path.join(EXTRACTIONS_DIR, f"{pipeline_id}.md")
         
         with open(content_file, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -4,16 +4,29 @@ One-time setup to populate ChromaDB with Sendmarc brand voice examples
 """
 import os
 import chromadb
+from collections import OrderedDict
 from typing import List, Dict, Any
 from sentence_transformers import SentenceTransformer
 from pathlib import Path
 
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+CHROMADB_DIR = os.path.join(BASE_DIR, 'data', 'chromadb')
+BRAND_BLOGS_DIR = os.path.join(BASE_DIR, 'data', 'sendmarc_blogs')
+
+
+# Length of the pre-truncated chunk preview stored with each example for prompts
+BRAND_PREVIEW_CHARS = 400
 
 # Global instances
 _embedding_model = None
 _chroma_client = None
 _collection = None
 
+# Retrieved examples per query, holding the largest n fetched so far; least recently
+# used queries are evicted beyond BRAND_EXAMPLES_CACHE_SIZE entries
+BRAND_EXAMPLES_CACHE_SIZE = 128
+_examples_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+
 
 def get_embedding_model():
     """Get or create embedding model instance"""
@@ -28,13 +41,8 @@ def get_chroma_client():
     """Get or create ChromaDB client"""
     global _chroma_client
     if _chroma_client is None:
-        db_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'data',
-            'chromadb'
-        )
-        os.makedirs(db_path, exist_ok=True)
-        _chroma_client = chromadb.PersistentClient(path=db_path)
+        os.makedirs(CHROMADB_DIR, exist_ok=True)
+        _chroma_client = chromadb.PersistentClient(path=CHROMADB_DIR)
     return _chroma_client
 
 
@@ -199,6 +207,7 @@ def populate_chromadb(source_dir: str) -> int:
             embedding = model.encode([chunk])[0].tolist()
             chunk_metadata = metadata.copy()
             chunk_metadata['chunk_index'] = i
+            chunk_metadata['preview'] = chunk[:BRAND_PREVIEW_CHARS]
             
             collection.add(
                 ids=[f"sample_{i}"],
@@ -208,6 +217,7 @@ def populate_chromadb(source_dir: str) -> int:
             )
         
         print(f"Added {len(chunks)} sample chunks to collection")
+        clear_brand_examples_cache()
         return len(chunks)
     
     markdown_files = list(source_path.glob('*.md'))
@@ -238,6 +248,7 @@ def populate_chromadb(source_dir: str) -> int:
             for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
                 chunk_metadata = metadata.copy()
                 chunk_metadata['chunk_index'] = i
+                chunk_metadata['preview'] = chunk[:BRAND_PREVIEW_CHARS]
                 
                 doc_id = f"{md_file.stem}_{i}"
                 
@@ -256,6 +267,10 @@ def populate_chromadb(source_dir: str) -> int:
     
     print(f"✓ Populated ChromaDB with {total_chunks} total chunks from {len(markdown_files)} files")
     
+    # Retrievals made before these chunks existed are stale
+    if total_chunks:
+        clear_brand_examples_cache()
+    
     return total_chunks
 
 
@@ -270,6 +285,12 @@ def retrieve_brand_examples(query: str, n: int = 5) -> List[Dict[str, Any]]:
     Returns:
         List of relevant content chunks with metadata
     """
+    # Results are ordered by distance, so a cached top-k also answers any smaller n
+    cached = _examples_cache.get(query)
+    if cached is not None and len(cached) >= n:
+        _examples_cache.move_to_end(query)
+        return [dict(example) for example in cached[:n]]
+    
     collection = get_or_create_collection()
     model = get_embedding_model()
     
@@ -299,7 +320,18 @@ def retrieve_brand_examples(query: str, n: int = 5) -> List[Dict[str, Any]]:
             }
             examples.append(example)
     
-    return examples
+    if examples:
+        _examples_cache[query] = examples
+        _examples_cache.move_to_end(query)
+        if len(_examples_cache) > BRAND_EXAMPLES_CACHE_SIZE:
+            _examples_cache.popitem(last=False)
+    
+    return [dict(example) for example in examples]
+
+
+def clear_brand_examples_cache() -> None:
+    """Drop cached brand voice retrievals (e.g. after repopulating the collection)"""
+    _examples_cache.clear()
 
 
 def run(source_dir: str = None) -> Dict[str, Any]:
@@ -314,11 +346,7 @@ def run(source_dir: str = None) -> Dict[str, Any]:
     """
     try:
         if source_dir is None:
-            source_dir = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                'data',
-                'sendmarc_blogs'
-            )
+            source_dir = BRAND_BLOGS_DIR
         
         chunk_count = populate_chromadb(source_dir)
         
@@ -8,15 +8,13 @@ from typing import Dict, Any, List
 from utils.llm_client import call_with_structured_output
 from stages.stage4_rag_setup import retrieve_brand_examples
 
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+PROMPTS_PATH = os.path.join(BASE_DIR, 'config', 'prompts.yaml')
+
 
 def load_prompts() -> Dict[str, Any]:
     """Load prompts from configuration"""
-    config_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'config',
-        'prompts.yaml'
-    )
-    with open(config_path, 'r') as f:
+    with open(PROMPTS_PATH, 'r') as f:
         return yaml.safe_load(f)
 
 
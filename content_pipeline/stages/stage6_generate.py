@@ -3,19 +3,29 @@ Stage 6: Original Content Generation - Full Draft
 Generates complete article following the outline
 """
 import os
+import asyncio
+import logging
 import yaml
-from typing import Dict, Any
-from utils.llm_client import call_gemini
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from utils.llm_client import call_gemini, astream_gemini, run_coroutine
+from utils.validation import extract_headings
+from stages.stage4_rag_setup import BRAND_PREVIEW_CHARS
+
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+PROMPTS_PATH = os.path.join(BASE_DIR, 'config', 'prompts.yaml')
+DRAFTS_DIR = os.path.join(BASE_DIR, 'data', 'drafts')
+
+logger = logging.getLogger(__name__)
+
+
+# Characters a complete (non-truncated) draft is expected to end with
+_COMPLETE_ENDINGS = ('.', '!', '?', ':', ';', ')', ']', '}')
 
 
 def load_prompts() -> Dict[str, Any]:
     """Load prompts from configuration"""
-    config_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'config',
-        'prompts.yaml'
-    )
-    with open(config_path, 'r') as f:
+    with open(PROMPTS_PATH, 'r') as f:
         return yaml.safe_load(f)
 
 
@@ -61,19 +71,48 @@ def format_brand_examples(examples: list) -> str:
     
     formatted = []
     for i, example in enumerate(examples[:3], 1):  # Limit to 3 to save tokens
-        content = example.get('content', '')[:400]  # Truncate for token limit
+        # Previews are truncated at ingest (Stage 4); older entries fall back to slicing
+        content = (example.get('metadata') or {}).get('preview')
+        if content is None:
+            content = example.get('content', '')[:BRAND_PREVIEW_CHARS]
         formatted.append(f"Example {i}:\n{content}...\n")
     
     return '\n'.join(formatted)
 
 
-def generate_full_draft(
+def strip_code_fence(content: str) -> str:
+    """
+    Remove a wrapping markdown code fence (```markdown ... ```) if present
+    
+    Args:
+        content: Generated content
+        
+    Returns:
+        Content without the surrounding fence lines
+    """
+    stripped = content.lstrip()
+    if not stripped.startswith('```'):
+        return content
+    
+    # Drop the opening ```markdown / ``` line
+    newline = stripped.find('\n')
+    content = stripped[newline + 1:] if newline != -1 else ''
+    
+    # Drop the closing ``` line
+    body = content.rstrip()
+    if body.endswith('```') and body[:-3].endswith('\n'):
+        content = body[:-3].rstrip('\n')
+    
+    return content
+
+
+def build_draft_prompts(
     outline: Dict[str, Any],
     brief: Dict[str, Any],
     brand_examples: list
-) -> str:
+) -> Tuple[str, str]:
     """
-    Generate full article content
+    Build the user and system prompts for full draft generation
     
     Args:
         outline: Structured outline
@@ -81,10 +120,8 @@ def generate_full_draft(
         brand_examples: Retrieved brand voice examples
         
     Returns:
-        Generated markdown content
+        Tuple of (user_prompt, system_prompt)
     """
-    print("Generating full article draft...")
-    
     prompts = load_prompts()['prompts']
     system_prompt = prompts['full_draft_generation']['system']
     context_prompt = prompts['full_draft_generation']['context'].format(
@@ -113,6 +150,51 @@ Unique Angles: {', '.join(brief.get('unique_angles', []))}
     
     full_system = f"{system_prompt}\n\n{context_prompt}"
     
+    return user_prompt, full_system
+
+
+def finalize_draft(content: str) -> str:
+    """
+    Check a raw model response for truncation and clean it up
+    
+    Args:
+        content: Raw generated content
+        
+    Returns:
+        Cleaned markdown content
+    """
+    # Check if content appears truncated (ends mid-sentence or very abruptly)
+    word_count = len(content.split())
+    stripped = content.rstrip()
+    if stripped and not stripped.endswith(_COMPLETE_ENDINGS):
+        print(f"⚠ Warning: Content may be truncated (ends with: ...{stripped[-30:]})")
+    
+    print(f"✓ Generated article draft ({word_count} words)")
+    
+    # Ensure content starts properly (remove any markdown code block markers if present)
+    return strip_code_fence(content)
+
+
+def generate_full_draft(
+    outline: Dict[str, Any],
+    brief: Dict[str, Any],
+    brand_examples: list
+) -> str:
+    """
+    Generate full article content
+    
+    Args:
+        outline: Structured outline
+        brief: Content brief
+        brand_examples: Retrieved brand voice examples
+        
+    Returns:
+        Generated markdown content
+    """
+    print("Generating full article draft...")
+    
+    user_prompt, full_system = build_draft_prompts(outline, brief, brand_examples)
+    
     try:
         # Use higher temperature for more creative writing
         content = call_gemini(
@@ -121,26 +203,60 @@ Unique Angles: {', '.join(brief.get('unique_angles', []))}
             temperature=0.8
         )
         
-        # Check if content appears truncated (ends mid-sentence or very abruptly)
-        word_count = len(content.split())
-        if content.strip() and not content.rstrip().endswith(('.', '!', '?', ':', ';')):
-            # Content might be truncated - check last 100 chars
-            last_chars = content.rstrip()[-100:]
-            if not any(last_chars.endswith(ending) for ending in ['.', '!', '?', ':', ';', ')', ']', '}']):
-                print(f"⚠ Warning: Content may be truncated (ends with: ...{last_chars[-30:]})")
-        
-        print(f"✓ Generated article draft ({word_count} words)")
-        
-        # Ensure content starts properly (remove any markdown code block markers if present)
-        if content.strip().startswith('```'):
-            lines = content.split('\n')
-            # Remove first line if it's ```markdown or ```
-            if lines[0].strip().startswith('```'):
-                lines = lines[1:]
-            # Remove last line if it's just ```
-            if lines and lines[-1].strip() == '```':
-                lines = lines[:-1]
-            content = '\n'.join(lines)
+        return finalize_draft(content)
+        
+    except Exception as e:
+        print(f"Draft generation failed: {e}")
+        raise
+
+
+async def agenerate_full_draft(
+    outline: Dict[str, Any],
+    brief: Dict[str, Any],
+    brand_examples: list,
+    draft_file: Optional[str] = None
+) -> str:
+    """
+    Async, streaming variant of generate_full_draft
+    
+    Args:
+        outline: Structured outline
+        brief: Content brief
+        brand_examples: Retrieved brand voice examples
+        draft_file: If given, chunks are written here as they arrive and the
+            file is left holding the final cleaned content
+        
+    Returns:
+        Generated markdown content
+    """
+    print("Generating full article draft...")
+    
+    user_prompt, full_system = build_draft_prompts(outline, brief, brand_examples)
+    
+    try:
+        chunks = []
+        # Use higher temperature for more creative writing
+        stream = astream_gemini(
+            prompt=user_prompt,
+            system=full_system,
+            temperature=0.8
+        )
+        
+        if draft_file:
+            with open(draft_file, 'w', encoding='utf-8') as f:
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    f.write(chunk)
+                    f.flush()
+        else:
+            async for chunk in stream:
+                chunks.append(chunk)
+        
+        raw_content = ''.join(chunks)
+        content = finalize_draft(raw_content)
+        
+        if draft_file and content != raw_content:
+            Path(draft_file).write_text(content, encoding='utf-8')
         
         return content
         
@@ -149,13 +265,18 @@ Unique Angles: {', '.join(brief.get('unique_angles', []))}
         raise
 
 
-def validate_draft(content: str, outline: Dict[str, Any]) -> tuple[bool, list]:
+def validate_draft(
+    content: str,
+    outline: Dict[str, Any],
+    headings: Optional[Dict[str, List[str]]] = None
+) -> tuple[bool, list]:
     """
     Validate generated draft
     
     Args:
         content: Generated markdown content
         outline: Original outline
+        headings: Pre-extracted headings (from extract_headings), computed if omitted
         
     Returns:
         Tuple of (is_valid, list_of_issues)
@@ -179,7 +300,9 @@ def validate_draft(content: str, outline: Dict[str, Any]) -> tuple[bool, list]:
         issues.append("Content doesn't start with H1")
     
     # Check for multiple H2 sections
-    h2_count = content.count('\n## ')
+    if headings is None:
+        headings = extract_headings(content)
+    h2_count = len(headings['h2'])
     if h2_count < 3:
         issues.append(f"Too few H2 sections ({h2_count}, minimum 3)")
     
@@ -198,13 +321,18 @@ def validate_draft(content: str, outline: Dict[str, Any]) -> tuple[bool, list]:
     return len(issues) == 0, issues
 
 
-def extract_metadata_from_draft(content: str, outline: Dict[str, Any]) -> Dict[str, Any]:
+def extract_metadata_from_draft(
+    content: str,
+    outline: Dict[str, Any],
+    headings: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, Any]:
     """
     Extract metadata from generated draft
     
     Args:
         content: Generated content
         outline: Original outline
+        headings: Pre-extracted headings (from extract_headings), computed if omitted
         
     Returns:
         Metadata dictionary
@@ -213,13 +341,9 @@ def extract_metadata_from_draft(content: str, outline: Dict[str, Any]) -> Dict[s
         raise ValueError(f"Invalid outline provided: {type(outline)}")
     
     # Extract title (first H1)
-    lines = content.split('\n')
-    title = outline.get('h1', '')
-    
-    for line in lines:
-        if line.strip().startswith('# '):
-            title = line.strip()[2:]
-            break
+    if headings is None:
+        headings = extract_headings(content)
+    title = headings['h1'][0] if headings['h1'] else outline.get('h1', '')
     
     return {
         'title': title,
@@ -242,6 +366,26 @@ def run(
     """
     Execute Stage 6: Full Draft Generation
     
+    Args:
+        pipeline_id: Unique pipeline identifier
+        outline_output: Output from Stage 5
+        analysis_output: Output from Stage 2
+        
+    Returns:
+        Stage output dictionary
+    """
+    # Shared loop, not asyncio.run(): the SDK's async channels outlive a single run
+    return run_coroutine(arun(pipeline_id, outline_output, analysis_output))
+
+
+async def arun(
+    pipeline_id: str,
+    outline_output: Dict[str, Any],
+    analysis_output: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Execute Stage 6 asynchronously (several pipelines can be gathered together)
+    
     Args:
         pipeline_id: Unique pipeline identifier
         outline_output: Output from Stage 5
@@ -251,9 +395,12 @@ def run(
         Stage output dictionary
     """
     try:
-        # DEBUG: Log what we receive
-        print(f"\n[DEBUG Stage 6] Received outline_output type: {type(outline_output)}")
-        print(f"[DEBUG Stage 6] outline_output keys: {list(outline_output.keys()) if isinstance(outline_output, dict) else 'NOT A DICT'}")
+        # Arguments are only formatted when DEBUG logging is enabled
+        logger.debug(
+            "Received outline_output type: %s, keys: %s",
+            type(outline_output),
+            outline_output.keys() if isinstance(outline_output, dict) else 'NOT A DICT'
+        )
         
         # Validate inputs first
         if not isinstance(outline_output, dict):
@@ -270,14 +417,12 @@ def run(
         # Check if outline exists - use .get() to avoid KeyError
         if 'outline' not in outline_output:
             available_keys = list(outline_output.keys())
-            print(f"[DEBUG Stage 6] ERROR: 'outline' key missing! Available keys: {available_keys}")
+            logger.debug("'outline' key missing! Available keys: %s", available_keys)
             raise KeyError(f"Stage 5 output missing 'outline' key. Available keys: {available_keys}. Stage 5 may have failed.")
         
-        print(f"[DEBUG Stage 6] 'outline' key exists in outline_output")
-        
         # Use .get() to avoid KeyError, then validate
         outline = outline_output.get('outline')
-        print(f"[DEBUG Stage 6] Got outline, type: {type(outline)}")
+        logger.debug("Got outline, type: %s", type(outline))
         
         if outline is None:
             raise ValueError("Outline is None in Stage 5 output. Stage 5 may have failed to generate outline.")
@@ -289,7 +434,7 @@ def run(
         if not outline:
             raise Exception("Outline is empty. Stage 5 may have failed to generate outline.")
         
-        print(f"[DEBUG Stage 6] Outline keys: {list(outline.keys())}")
+        logger.debug("Outline keys: %s", outline.keys())
         
         # Validate outline has required keys
         required_keys = ['h1', 'sections']
@@ -297,7 +442,7 @@ def run(
         if missing_keys:
             raise KeyError(f"Outline missing required keys: {missing_keys}. Available keys: {list(outline.keys())}")
         
-        print(f"[DEBUG Stage 6] Outline validation passed, proceeding to generate draft...")
+        logger.debug("Outline validation passed, proceeding to generate draft")
         
         # Check if analysis output is valid
         if not analysis_output.get('success', False):
@@ -311,7 +456,8 @@ def run(
         # Get brand examples (retrieve again or use cached)
         from stages.stage4_rag_setup import retrieve_brand_examples
         topic = brief.get('target_topic', '')
-        brand_examples = retrieve_brand_examples(topic, n=3)
+        # Chroma query and embedding are blocking; keep them off the event loop
+        brand_examples = await asyncio.to_thread(retrieve_brand_examples, topic, n=3)
         
         if not brand_examples:
             # Create default example
@@ -320,29 +466,22 @@ def run(
                 'metadata': {'topic': 'email_security', 'technical_level': 'intermediate'}
             }]
         
-        # Generate full draft
-        content = generate_full_draft(outline, brief, brand_examples)
+        # Generate full draft, streaming it to file as it arrives
+        Path(DRAFTS_DIR).mkdir(parents=True, exist_ok=True)
+        draft_file = os.path.join(DRAFTS_DIR, f"{pipeline_id}.md")
+        content = await agenerate_full_draft(outline, brief, brand_examples, draft_file)
+        
+        # Scan headings once and share them with validation, metadata and Stage 7
+        headings = extract_headings(content)
         
         # Validate draft
-        is_valid, issues = validate_draft(content, outline)
+        is_valid, issues = validate_draft(content, outline, headings)
         
         if not is_valid:
             print(f"⚠ Draft validation warnings: {', '.join(issues)}")
         
         # Extract metadata
-        metadata = extract_metadata_from_draft(content, outline)
-        
-        # Save draft to file
-        output_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'data',
-            'drafts'
-        )
-        os.makedirs(output_dir, exist_ok=True)
-        
-        draft_file = os.path.join(output_dir, f"{pipeline_id}.md")
-        with open(draft_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        metadata = extract_metadata_from_draft(content, outline, headings)
         
         print(f"Saved draft to {draft_file}")
         
@@ -350,6 +489,7 @@ def run(
             'success': True,
             'content': content,
             'metadata': metadata,
+            'headings': headings,
             'validation': {
                 'is_valid': is_valid,
                 'issues': issues
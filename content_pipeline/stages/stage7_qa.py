@@ -3,33 +3,78 @@ Stage 7: Quality Assurance & Validation
 Performs plagiarism checking, fact checking, SEO scoring, and brand voice validation
 """
 import os
+import json
+import hashlib
+import tempfile
 import yaml
 import numpy as np
-from typing import Dict, Any, List, Tuple
-from sklearn.metrics.pairwise import cosine_similarity
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 from utils.validation import (
     calculate_readability,
     check_keyword_density,
     count_words,
-    validate_meta_description,
+    tokenize,
+    is_meta_description_valid,
     find_internal_link_opportunities,
     extract_headings
 )
 from utils.llm_client import call_with_structured_output
 from stages.stage4_rag_setup import get_embedding_model, chunk_content
 
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+SEO_RULES_PATH = os.path.join(BASE_DIR, 'config', 'seo_rules.yaml')
+FINGERPRINTS_DIR = os.path.join(BASE_DIR, 'data', 'fingerprints')
+PROMPTS_PATH = os.path.join(BASE_DIR, 'config', 'prompts.yaml')
+FACT_CHECK_CACHE_DIR = os.path.join(BASE_DIR, 'data', 'cache', 'fact_check')
+
 
 def load_seo_rules() -> Dict[str, Any]:
     """Load SEO rules from configuration"""
-    config_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'config',
-        'seo_rules.yaml'
-    )
-    with open(config_path, 'r') as f:
+    with open(SEO_RULES_PATH, 'r') as f:
         return yaml.safe_load(f)
 
 
+def _normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize embedding rows (zero rows are left as zeros)"""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms
+
+
+def max_cosine_similarity(
+    new_embeddings: np.ndarray,
+    competitor_embeddings: np.ndarray,
+    block_size: int = 256
+) -> np.ndarray:
+    """
+    Compute each new embedding's highest cosine similarity to the competitor set
+    
+    Args:
+        new_embeddings: (N, D) embeddings of generated content
+        competitor_embeddings: (M, D) competitor fingerprint
+        block_size: Rows of new_embeddings processed per matmul
+        
+    Returns:
+        (N,) array of max similarities
+    """
+    new_norm = _normalize_rows(new_embeddings)
+    comp_norm_t = _normalize_rows(competitor_embeddings).T
+    
+    n = new_norm.shape[0]
+    max_similarities = np.empty(n, dtype=np.float32)
+    if n == 0 or comp_norm_t.shape[1] == 0:
+        max_similarities.fill(0.0)
+        return max_similarities
+    
+    for start in range(0, n, block_size):
+        block = new_norm[start:start + block_size] @ comp_norm_t
+        max_similarities[start:start + block_size] = block.max(axis=1)
+    
+    return max_similarities
+
+
 def check_plagiarism(content: str, pipeline_id: str) -> Dict[str, Any]:
     """
     Check for plagiarism against competitor content
@@ -45,12 +90,7 @@ def check_plagiarism(content: str, pipeline_id: str) -> Dict[str, Any]:
     
     try:
         # Load competitor fingerprint
-        fingerprint_file = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'data',
-            'fingerprints',
-            f"{pipeline_id}.npy"
-        )
+        fingerprint_file = os.path.join(FINGERPRINTS_DIR, f"{pipeline_id}.npy")
         
         if not os.path.exists(fingerprint_file):
             print("Warning: No competitor fingerprint found")
@@ -60,28 +100,54 @@ def check_plagiarism(content: str, pipeline_id: str) -> Dict[str, Any]:
                 'passed': True
             }
         
+        # Stored as float16 by Stage 3; upcast happens once during normalization
         competitor_embeddings = np.load(fingerprint_file)
+        if competitor_embeddings.size == 0:
+            print("Warning: Competitor fingerprint is empty")
+            return {
+                'max_similarity': 0.0,
+                'flagged_chunks': [],
+                'passed': True
+            }
         
         # Generate embeddings for new content
         model = get_embedding_model()
         new_chunks = chunk_content(content, chunk_size=500)
-        new_embeddings = model.encode(new_chunks)
+        if not new_chunks:
+            return {
+                'max_similarity': 0.0,
+                'flagged_chunks': [],
+                'passed': True
+            }
+        # One batch for the whole article; unit-length output keeps the matmul a pure cosine
+        new_embeddings = model.encode(
+            new_chunks,
+            batch_size=len(new_chunks),
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
         
-        # Calculate similarities
-        similarities = cosine_similarity(new_embeddings, competitor_embeddings)
-        max_similarities = similarities.max(axis=1)
+        # Calculate max similarity per chunk, blockwise so the full
+        # N x M similarity matrix is never materialized
+        max_similarities = max_cosine_similarity(new_embeddings, competitor_embeddings)
         
         # Find flagged chunks (>0.85 similarity)
         threshold = 0.85
-        flagged_indices = np.where(max_similarities > threshold)[0]
+        flagged_indices = np.flatnonzero(max_similarities > threshold)
         
-        flagged_chunks = []
-        for idx in flagged_indices:
-            flagged_chunks.append({
-                'chunk_index': int(idx),
-                'similarity': float(max_similarities[idx]),
+        # Convert to native Python values in bulk rather than boxing per element
+        flagged_chunks = [
+            {
+                'chunk_index': idx,
+                'similarity': similarity,
                 'content_preview': new_chunks[idx][:200] + '...'
-            })
+            }
+            for idx, similarity in zip(
+                flagged_indices.tolist(),
+                max_similarities[flagged_indices].tolist()
+            )
+        ]
         
         max_sim = float(max_similarities.max()) if len(max_similarities) > 0 else 0.0
         
@@ -110,6 +176,63 @@ def check_plagiarism(content: str, pipeline_id: str) -> Dict[str, Any]:
         }
 
 
+def _read_fact_check_cache(cache_file: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Load cached fact-check claims; any failure is treated as a cache miss
+    
+    Args:
+        cache_file: Cache entry path
+        
+    Returns:
+        Cached claims, or None on a miss (missing, unreadable or corrupt entries)
+    """
+    try:
+        claims = json.loads(Path(cache_file).read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        # Corrupt or partial entry: drop it so the draft is checked again
+        print(f"⚠ Discarding corrupt fact-check cache entry {cache_file}: {e}")
+        try:
+            Path(cache_file).unlink(missing_ok=True)
+        except OSError as unlink_error:
+            print(f"⚠ Could not remove fact-check cache entry: {unlink_error}")
+        return None
+    except OSError as e:
+        # e.g. cache path blocked by a file, or no read permission
+        print(f"⚠ Fact-check cache unavailable, checking without it: {e}")
+        return None
+    
+    return claims if isinstance(claims, list) else None
+
+
+def _write_fact_check_cache(cache_file: str, claims: List[Dict[str, Any]]) -> None:
+    """
+    Atomically store fact-check claims (written to a temp file, then renamed into place).
+    Failures are only logged: the cache is an optimization and must not lose the claims
+    
+    Args:
+        cache_file: Cache entry path
+        claims: Claims returned by the LLM
+    """
+    tmp_path = None
+    try:
+        cache_dir = os.path.dirname(cache_file)
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(claims, f)
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        print(f"⚠ Could not cache fact-check claims: {e}")
+        if tmp_path is not None:
+            try:
+                Path(tmp_path).unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
 def fact_check(content: str) -> List[Dict[str, Any]]:
     """
     Identify claims that need fact checking
@@ -123,18 +246,21 @@ def fact_check(content: str) -> List[Dict[str, Any]]:
     print("Performing fact check analysis...")
     
     try:
-        prompts_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'config',
-            'prompts.yaml'
-        )
-        
-        with open(prompts_path, 'r') as f:
+        with open(PROMPTS_PATH, 'r') as f:
             prompts = yaml.safe_load(f)['prompts']
         
         system_prompt = prompts['fact_checking']['system']
         user_prompt = prompts['fact_checking']['user'].format(content=content)
         
+        # Identical content + prompts give the same claims; key covers prompt edits too
+        cache_key = hashlib.sha256(f"{system_prompt}\0{user_prompt}".encode('utf-8')).hexdigest()
+        cache_file = os.path.join(FACT_CHECK_CACHE_DIR, f"{cache_key}.json")
+        
+        claims = _read_fact_check_cache(cache_file)
+        if claims is not None:
+            print(f"✓ Identified {len(claims)} factual claims (cached)")
+            return claims
+        
         result = call_with_structured_output(
             prompt=user_prompt,
             system=system_prompt,
@@ -144,6 +270,10 @@ def fact_check(content: str) -> List[Dict[str, Any]]:
         claims = result.get('claims', [])
         print(f"✓ Identified {len(claims)} factual claims")
         
+        # An empty result may come from a transient LLM failure, so it is not cached
+        if claims:
+            _write_fact_check_cache(cache_file, claims)
+        
         return claims
         
     except Exception as e:
@@ -151,13 +281,18 @@ def fact_check(content: str) -> List[Dict[str, Any]]:
         return []
 
 
-def score_seo(content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+def score_seo(
+    content: str,
+    metadata: Dict[str, Any],
+    headings: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, Any]:
     """
     Calculate comprehensive SEO score
     
     Args:
         content: Content to score
         metadata: Article metadata
+        headings: Headings extracted in Stage 6, computed if omitted
         
     Returns:
         SEO scoring results
@@ -171,8 +306,11 @@ def score_seo(content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
     # Extract text without markdown
     text = content.replace('#', '').replace('*', '').replace('_', '')
     
+    # Tokenize once and share the words between the helpers below
+    words = tokenize(text)
+    
     # Word count
-    word_count = count_words(text)
+    word_count = count_words(text, words)
     word_count_score = 0
     if word_count >= thresholds['word_count']['min']:
         word_count_score += 50
@@ -203,12 +341,13 @@ def score_seo(content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
         keyword_score += scoring['keyword_optimization']['primary_in_intro']
     
     # Keyword density
-    density = check_keyword_density(text, primary_keyword)
+    density = check_keyword_density(text, primary_keyword, words)
     if thresholds['keyword_density']['primary']['min'] <= density <= thresholds['keyword_density']['primary']['max']:
         keyword_score += scoring['keyword_optimization']['primary_density_ideal']
     
     # Structure scoring
-    headings = extract_headings(content)
+    if headings is None:
+        headings = extract_headings(content)
     structure_score = 0
     
     if len(headings['h1']) == 1:
@@ -233,8 +372,7 @@ def score_seo(content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
     # Meta optimization
     meta_score = 0
     meta_desc = metadata.get('meta_description', '')
-    is_valid, msg = validate_meta_description(meta_desc)
-    if is_valid:
+    if is_meta_description_valid(meta_desc):
         meta_score += scoring['meta_optimization']['description_length']
     if primary_keyword.lower() in meta_desc.lower():
         meta_score += scoring['meta_optimization']['description_includes_keyword']
@@ -400,7 +538,7 @@ def run(
         # Run all checks
         plagiarism_results = check_plagiarism(content, pipeline_id)
         fact_check_results = fact_check(content)
-        seo_results = score_seo(content, metadata)
+        seo_results = score_seo(content, metadata, draft_output.get('headings'))
         
         # Generate quality report
         quality_report = generate_quality_report(
@@ -3,114 +3,51 @@ Stage 8: HTML Structuring & Production Formatting
 Converts markdown to production-ready HTML with proper structure and metadata
 """
 import os
-import json
-from typing import Dict, Any
+import orjson
+import threading
+from html import escape
+from pathlib import Path
+from typing import Dict, Any, Tuple
 import markdown
-from jinja2 import Template
 from datetime import datetime
+from functools import lru_cache
 from utils.validation import validate_html
 
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+OUTPUTS_DIR = os.path.join(BASE_DIR, 'data', 'outputs')
 
-def markdown_to_html(content: str) -> str:
-    """
-    Convert markdown to HTML with extensions
-    
-    Args:
-        content: Markdown content
-        
-    Returns:
-        HTML content
-    """
-    print("Converting markdown to HTML...")
-    
-    md = markdown.Markdown(extensions=[
-        'extra',  # Tables, fenced code blocks, etc.
-        'toc',    # Table of contents
-        'nl2br',  # Newline to break
-        'sane_lists'
-    ])
-    
-    html = md.convert(content)
-    
-    return html
-
-
-def generate_schema_markup(metadata: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Generate Schema.org Article markup
-    
-    Args:
-        metadata: Article metadata
-        
-    Returns:
-        Schema.org JSON-LD dictionary
-    """
-    schema = {
-        "@context": "https://schema.org",
-        "@type": "Article",
-        "headline": metadata.get('title', ''),
-        "description": metadata.get('meta_description', ''),
-        "author": {
-            "@type": "Organization",
-            "name": "Sendmarc"
-        },
-        "publisher": {
-            "@type": "Organization",
-            "name": "Sendmarc",
-            "logo": {
-                "@type": "ImageObject",
-                "url": "https://sendmarc.com/logo.png"
-            }
-        },
-        "datePublished": datetime.utcnow().isoformat(),
-        "dateModified": datetime.utcnow().isoformat()
-    }
-    
-    return schema
-
-
-def apply_template(html: str, metadata: Dict[str, Any], schema: Dict[str, Any]) -> str:
-    """
-    Apply Jinja2 template with Sendmarc styling
-    
-    Args:
-        html: HTML content
-        metadata: Article metadata
-        schema: Schema.org markup
-        
-    Returns:
-        Complete HTML with template
-    """
-    print("Applying HTML template...")
-    
-    template_str = '''<!DOCTYPE html>
+# <head> meta tags and schema (str.format template) - everything before the static styles
+ARTICLE_HEAD_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{ title }}</title>
+    <title>{title}</title>
     
     <!-- Meta Tags -->
-    <meta name="description" content="{{ meta_description }}">
+    <meta name="description" content="{meta_description}">
     <meta name="author" content="Sendmarc">
     
     <!-- OpenGraph Tags -->
-    <meta property="og:title" content="{{ title }}">
-    <meta property="og:description" content="{{ meta_description }}">
+    <meta property="og:title" content="{title}">
+    <meta property="og:description" content="{meta_description}">
     <meta property="og:type" content="article">
     <meta property="og:site_name" content="Sendmarc">
     
     <!-- Twitter Card -->
     <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:title" content="{{ title }}">
-    <meta name="twitter:description" content="{{ meta_description }}">
+    <meta name="twitter:title" content="{title}">
+    <meta name="twitter:description" content="{meta_description}">
     
     <!-- Schema.org Markup -->
     <script type="application/ld+json">
-    {{ schema_json }}
+    {schema_json}
     </script>
     
-    <!-- Sendmarc Styles (placeholder - replace with actual stylesheet) -->
+'''
+
+# Static stylesheet and <body> opening; emitted verbatim
+ARTICLE_STATIC_STYLE = '''    <!-- Sendmarc Styles (placeholder - replace with actual stylesheet) -->
     <style>
         body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
@@ -210,43 +147,158 @@ def apply_template(html: str, metadata: Dict[str, Any], schema: Dict[str, Any])
     </style>
 </head>
 <body>
-    <article>
+'''
+
+# Article body (str.format template)
+ARTICLE_BODY_TEMPLATE = '''    <article>
         <header>
-            <h1>{{ title }}</h1>
+            <h1>{title}</h1>
             <div class="meta-info">
-                Published by <strong>Sendmarc</strong> on {{ date }}
+                Published by <strong>Sendmarc</strong> on {date}
             </div>
         </header>
         
-        {{ content|safe }}
+        {content}
         
-        {% if internal_links %}
-        <aside class="internal-links">
-            <h3>Related Resources</h3>
-            <ul>
-            {% for link in internal_links %}
-                <li><a href="#">{{ link }}</a></li>
-            {% endfor %}
-            </ul>
-        </aside>
-        {% endif %}
+        {internal_links}
     </article>
 </body>
 </html>
 '''
+
+# Body split around the article content so the content is written to disk without copying
+ARTICLE_BODY_OPEN, _, ARTICLE_BODY_CLOSE = ARTICLE_BODY_TEMPLATE.partition('{content}')
+
+# Markdown emphasis/heading markers removed before scanning for link opportunities
+_MARKDOWN_MARKERS = str.maketrans('', '', '#*')
+
+# Schema.org Article fields that never change between articles
+_SCHEMA_BASE = {
+    "@context": "https://schema.org",
+    "@type": "Article",
+    "author": {
+        "@type": "Organization",
+        "name": "Sendmarc"
+    },
+    "publisher": {
+        "@type": "Organization",
+        "name": "Sendmarc",
+        "logo": {
+            "@type": "ImageObject",
+            "url": "https://sendmarc.com/logo.png"
+        }
+    }
+}
+
+# Per-thread Markdown converter, reused across documents via reset()
+_markdown_local = threading.local()
+
+# Related-resources aside, only emitted when there are internal links
+INTERNAL_LINKS_TEMPLATE = '''<aside class="internal-links">
+            <h3>Related Resources</h3>
+            <ul>
+{items}
+            </ul>
+        </aside>'''
+
+
+def get_markdown() -> markdown.Markdown:
+    """Get or create this thread's Markdown converter (instances are not thread-safe)"""
+    md = getattr(_markdown_local, 'md', None)
+    if md is None:
+        md = markdown.Markdown(extensions=[
+            'extra',  # Tables, fenced code blocks, etc.
+            'toc',    # Table of contents
+            'nl2br',  # Newline to break
+            'sane_lists'
+        ])
+        _markdown_local.md = md
+    return md
+
+
+def markdown_to_html(content: str) -> str:
+    """
+    Convert markdown to HTML with extensions
+    
+    Args:
+        content: Markdown content
+        
+    Returns:
+        HTML content
+    """
+    print("Converting markdown to HTML...")
+    
+    html = get_markdown().reset().convert(content)
+    
+    return html
+
+
+def generate_schema_markup(metadata: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    """
+    Generate Schema.org Article markup
+    
+    Args:
+        metadata: Article metadata
+        
+    Returns:
+        Tuple of (Schema.org JSON-LD dictionary, the same serialized as compact JSON)
+    """
+    now = datetime.utcnow().isoformat()
     
-    template = Template(template_str)
+    schema = {
+        **_SCHEMA_BASE,
+        "headline": metadata.get('title', ''),
+        "description": metadata.get('meta_description', ''),
+        "datePublished": now,
+        "dateModified": now
+    }
     
-    rendered = template.render(
-        title=metadata.get('title', 'Sendmarc Blog Post'),
-        meta_description=metadata.get('meta_description', ''),
-        content=html,
-        schema_json=json.dumps(schema, indent=2),
-        date=datetime.utcnow().strftime('%B %d, %Y'),
-        internal_links=metadata.get('internal_links', [])
+    # Compact JSON-LD; '</' is escaped so a title cannot close the <script> element
+    return schema, orjson.dumps(schema).decode('utf-8').replace('</', '<\\/')
+
+
+def apply_template(html: str, metadata: Dict[str, Any], schema_json: str, out_path: str) -> None:
+    """
+    Apply the HTML article template with Sendmarc styling, streaming the page to a file
+    
+    Args:
+        html: HTML content
+        metadata: Article metadata
+        schema_json: Serialized Schema.org markup
+        out_path: Path of the HTML file to write
+    """
+    print("Applying HTML template...")
+    
+    title = escape(metadata.get('title', 'Sendmarc Blog Post'))
+    
+    internal_links = metadata.get('internal_links', [])
+    links_html = ''
+    if internal_links:
+        links_html = INTERNAL_LINKS_TEMPLATE.format(items='\n'.join(
+            f'                <li><a href="#">{escape(link)}</a></li>' for link in internal_links
+        ))
+    
+    head = ARTICLE_HEAD_TEMPLATE.format(
+        title=title,
+        meta_description=escape(metadata.get('meta_description', '')),
+        schema_json=schema_json
+    )
+    body_open = ARTICLE_BODY_OPEN.format(
+        title=title,
+        date=datetime.utcnow().strftime('%B %d, %Y')
     )
+    body_close = ARTICLE_BODY_CLOSE.format(internal_links=links_html)
     
-    return rendered
+    pieces = (head, ARTICLE_STATIC_STYLE, body_open, html, body_close)
+    with open(out_path, 'w', encoding='utf-8') as f:
+        for piece in pieces:
+            f.write(piece)
+
+
+@lru_cache(maxsize=1024)
+def _slugify(text: str) -> str:
+    """URL slug for an internal link topic"""
+    return text.lower().replace(' ', '-')
 
 
 def add_internal_links(html: str, opportunities: list) -> tuple[str, list]:
@@ -268,7 +320,7 @@ def add_internal_links(html: str, opportunities: list) -> tuple[str, list]:
     for opp in opportunities[:3]:  # Limit to top 3
         suggested_links.append({
             'text': opp,
-            'url': f"/blog/{opp.lower().replace(' ', '-')}",
+            'url': f"/blog/{_slugify(opp)}",
             'utm_params': '?utm_source=blog&utm_medium=internal_link'
         })
     
@@ -320,11 +372,11 @@ def run(
             print(f"⚠ HTML validation issues: {', '.join(issues)}")
         
         # Generate Schema.org markup
-        schema = generate_schema_markup(metadata)
+        schema, schema_json = generate_schema_markup(metadata)
         
         # Add internal link opportunities from QA
         from utils.validation import find_internal_link_opportunities
-        text = content.replace('#', '').replace('*', '')
+        text = content.translate(_MARKDOWN_MARKERS)
         internal_links = find_internal_link_opportunities(text)
         
         html, suggested_links = add_internal_links(html, internal_links)
@@ -333,23 +385,14 @@ def run(
         # Process images (placeholder for MVP)
         html = process_images(html)
         
-        # Apply template
-        final_html = apply_template(html, metadata, schema)
-        
-        # Save HTML output
-        output_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'data',
-            'outputs'
-        )
-        os.makedirs(output_dir, exist_ok=True)
+        # Apply template and stream the page to the HTML output
+        Path(OUTPUTS_DIR).mkdir(parents=True, exist_ok=True)
         
-        html_file = os.path.join(output_dir, f"{pipeline_id}.html")
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(final_html)
+        html_file = os.path.join(OUTPUTS_DIR, f"{pipeline_id}.html")
+        apply_template(html, metadata, schema_json, html_file)
         
         # Save metadata separately
-        metadata_file = os.path.join(output_dir, f"{pipeline_id}_metadata.json")
+        metadata_file = os.path.join(OUTPUTS_DIR, f"{pipeline_id}_metadata.json")
         full_metadata = {
             **metadata,
             'schema': schema,
@@ -357,8 +400,7 @@ def run(
             'suggested_links': suggested_links
         }
         
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(full_metadata, f, indent=2)
+        Path(metadata_file).write_bytes(orjson.dumps(full_metadata, option=orjson.OPT_INDENT_2))
         
         print(f"✓ HTML saved to {html_file}")
         print(f"✓ Metadata saved to {metadata_file}")
@@ -367,8 +409,6 @@ def run(
             'success': True,
             'html_file': html_file,
             'metadata_file': metadata_file,
-            'html_preview': final_html[:500] + '...',
-            'metadata': full_metadata,
             'validation': {
                 'is_valid': is_valid,
                 'issues': issues
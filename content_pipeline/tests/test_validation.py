@@ -0,0 +1,142 @@
+"""
+Tests for utils.validation
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import validation
+from utils.validation import (
+    check_keyword_density,
+    check_keyword_density_batch,
+    find_internal_link_opportunities
+)
+
+# Fast-path parsers as imported by the module (None if not installed)
+FAST_LEXBOR = validation.LexborHTMLParser
+FAST_LXML_HTML = validation.lxml_html
+FAST_ETREE = validation.etree
+
+
+TEXT = (
+    "DMARC protects domains. A DMARC policy (p=reject) blocks spoofing; dmarc reports help. "
+    "aa aa aa. C++ and c++ differ from C. SPF, spf-record and spfrecord. Email authentication "
+    "with SPF and DKIM is email authentication done right."
+)
+
+KEYWORDS = [
+    'dmarc', 'DMARC policy', 'dmarc policy (p=reject)', 'aa', 'aa aa', 'aa aa aa',
+    'C++', 'c', 'spf', 'spf-record', 'email authentication', 'email', 'missing', ''
+]
+
+
+def test_batch_matches_single_keyword_density():
+    batch = check_keyword_density_batch(TEXT, KEYWORDS)
+    
+    for keyword in KEYWORDS:
+        assert batch[keyword] == check_keyword_density(TEXT, keyword), keyword
+
+
+def test_batch_matches_single_with_pretokenized_words():
+    words = ['w'] * 40
+    batch = check_keyword_density_batch(TEXT, KEYWORDS, words)
+    
+    for keyword in KEYWORDS:
+        assert batch[keyword] == check_keyword_density(TEXT, keyword, words), keyword
+
+
+def test_overlapping_occurrences_count_once():
+    text = 'aa aa aa'
+    
+    assert check_keyword_density(text, 'aa aa') == 1 / 3
+    assert check_keyword_density_batch(text, ['aa aa', 'aa']) == {'aa aa': 1 / 3, 'aa': 1.0}
+
+
+def test_batch_handles_non_ascii_case_folding():
+    # 'ſ' matches 's' under IGNORECASE but does not lowercase to it
+    text = 'ſpf record and SPF'
+    
+    assert check_keyword_density_batch(text, ['spf', 'SPF record']) == {
+        'spf': check_keyword_density(text, 'spf'),
+        'SPF record': check_keyword_density(text, 'SPF record')
+    }
+    assert check_keyword_density_batch('ſpf record', ['spf']) == {'spf': 0.5}
+
+
+def test_empty_keyword_has_zero_density():
+    assert check_keyword_density(TEXT, '') == 0.0
+    assert check_keyword_density_batch(TEXT, [''])[''] == 0.0
+
+
+SAMPLE_HTML = (
+    '<html><head><title>t</title><style>p {}</style></head><body>'
+    '<nav>menu</nav><h1>Guide</h1><p>Intro <a href="/dmarc">DMARC</a> text.</p>'
+    '<h2>SPF</h2><p>See <a href="https://example.com/spf">SPF</a> or '
+    '<a href="mailto:a@example.com">mail</a> and <a href="#top">top</a>.</p>'
+    '<h3>Details</h3><h2>DKIM</h2><script>var x = 1;</script><footer>foot</footer>'
+    '</body></html>'
+)
+
+
+@pytest.fixture
+def bs4_fallback(monkeypatch):
+    """Force the BeautifulSoup code paths (and their SoupStrainers) used without selectolax/lxml"""
+    monkeypatch.setattr(validation, 'LexborHTMLParser', None)
+    monkeypatch.setattr(validation, 'lxml_html', None)
+    monkeypatch.setattr(validation, 'etree', None)
+    validation._heading_levels.cache_clear()
+    yield
+    validation._heading_levels.cache_clear()
+
+
+def _html_results(html):
+    return (
+        validation.extract_links(html),
+        validation.extract_headings(html),
+        validation.validate_html(html),
+        validation.validate_heading_hierarchy(html),
+        validation.extract_text_from_html(html)
+    )
+
+
+def test_bs4_fallback_matches_fast_paths(bs4_fallback):
+    fallback = _html_results(SAMPLE_HTML)
+    
+    with pytest.MonkeyPatch.context() as restore:
+        restore.setattr(validation, 'LexborHTMLParser', FAST_LEXBOR)
+        restore.setattr(validation, 'lxml_html', FAST_LXML_HTML)
+        restore.setattr(validation, 'etree', FAST_ETREE)
+        validation._heading_levels.cache_clear()
+        fast = _html_results(SAMPLE_HTML)
+    
+    assert fallback == fast
+    assert fallback[0] == {'internal': ['/dmarc', '#top'], 'external': ['https://example.com/spf']}
+    assert fallback[1]['h2'] == ['SPF', 'DKIM']
+    assert fallback[2] == (True, [])
+
+
+def test_bs4_fallback_rejects_tagless_input(bs4_fallback):
+    assert validation.validate_html('plain text') == (False, ['Empty or invalid HTML'])
+    assert validation.validate_heading_hierarchy('plain text') is False
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Configure ſpf', ['SPF Configuration']),
+    ('DKİM setup', ['DKIM Setup']),
+    ('phıshing', ['Phishing Prevention']),
+])
+def test_link_opportunities_with_non_ascii_case_folding(text, expected):
+    # These characters match ASCII letters under IGNORECASE but do not lowercase to them
+    assert find_internal_link_opportunities(text) == expected
+
+
+def test_link_opportunities_in_first_mention_order():
+    text = 'Stop phishing with a DMARC policy. Start with dmarc reports.'
+    
+    assert find_internal_link_opportunities(text) == [
+        'Phishing Prevention', 'DMARC Guide', 'DMARC Policy Configuration', 'DMARC Reporting'
+    ]
@@ -2,31 +2,147 @@
 Database Operations - SQLite wrapper for pipeline state management
 """
 import sqlite3
-import json
+import orjson
 import os
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+import atexit
+import queue
+import threading
+import zstandard as zstd
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Tuple
 from contextlib import contextmanager
 
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'pipeline.db')
 
+# Applied to every new connection; WAL lets readers proceed during writes and
+# synchronous=NORMAL only fsyncs at checkpoints, which is safe under WAL
+_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+)
+
+# orjson options for stored payloads: stringify non-str keys and accept numpy scalars/arrays
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# zstd level for stage output payloads (drafts, HTML, metadata)
+OUTPUT_COMPRESSION_LEVEL = 3
+
+# Audit events are buffered and written in one transaction every AUDIT_FLUSH_SIZE
+# events, on flush_audit_log(), before get_audit_log() reads, and at interpreter exit.
+# Each event carries its own timestamp, taken when it is logged rather than when flushed
+AUDIT_FLUSH_SIZE = 32
+_audit_buffer: List[Tuple[str, str, Optional[str], Optional[str], str]] = []
+_audit_lock = threading.Lock()
+
+# Fixed UPDATE statements keyed by (has safety_decision, has quality_score) so repeat
+# calls hit sqlite3's per-connection statement cache
+_UPD_STATUS = "UPDATE pipelines SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+_UPD_STATUS_DEC = "UPDATE pipelines SET status = ?, updated_at = CURRENT_TIMESTAMP, safety_decision = ? WHERE id = ?"
+_UPD_STATUS_SCORE = "UPDATE pipelines SET status = ?, updated_at = CURRENT_TIMESTAMP, quality_score = ? WHERE id = ?"
+_UPD_STATUS_BOTH = (
+    "UPDATE pipelines SET status = ?, updated_at = CURRENT_TIMESTAMP, "
+    "safety_decision = ?, quality_score = ? WHERE id = ?"
+)
+_UPDATE_STATUS_QUERIES = {
+    (False, False): _UPD_STATUS,
+    (True, False): _UPD_STATUS_DEC,
+    (False, True): _UPD_STATUS_SCORE,
+    (True, True): _UPD_STATUS_BOTH,
+}
+
+# Columns shown by pipeline listings (CLI --list and the dashboard sidebar)
+_PIPELINE_LIST_COLUMNS = 'id, source_url, status, created_at, updated_at, safety_decision, quality_score'
+
+# Small pool of connections shared by all threads; connections are opened lazily up to
+# POOL_SIZE and closed at interpreter exit
+POOL_SIZE = 8
+_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=POOL_SIZE)
+_pool_opened = 0
+_pool_lock = threading.Lock()
+
+
+def _open_connection() -> sqlite3.Connection:
+    """Open a new database connection with the standard pragmas"""
+    # Private page cache per connection (no cache=shared): WAL already gives concurrent
+    # readers, whereas a shared cache would fall back to table-level locking
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _acquire_connection() -> sqlite3.Connection:
+    """Take an idle pooled connection, opening one if the pool is not yet full"""
+    global _pool_opened
+    
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        pass
+    
+    with _pool_lock:
+        can_open = _pool_opened < POOL_SIZE
+        if can_open:
+            _pool_opened += 1
+    
+    if can_open:
+        try:
+            return _open_connection()
+        except Exception:
+            with _pool_lock:
+                _pool_opened -= 1
+            raise
+    
+    # Pool exhausted: wait for another thread to hand one back
+    return _pool.get()
+
+
+def close_connections() -> None:
+    """Close every idle pooled connection (registered with atexit)"""
+    global _pool_opened
+    
+    while True:
+        try:
+            conn = _pool.get_nowait()
+        except queue.Empty:
+            break
+        conn.close()
+        with _pool_lock:
+            _pool_opened -= 1
+
+
+atexit.register(close_connections)
+
+
 @contextmanager
 def get_connection():
-    """Context manager for database connections"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
+    """Context manager yielding a pooled connection inside a transaction"""
+    conn = _acquire_connection()
     try:
-        yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
+        with conn:  # Commits on success, rolls back on exception
+            yield conn
     finally:
-        conn.close()
+        _pool.put(conn)
+
+
+def _encode_output(data: Dict[str, Any]) -> bytes:
+    """Serialize and zstd-compress a stage output for storage"""
+    return zstd.ZstdCompressor(level=OUTPUT_COMPRESSION_LEVEL).compress(orjson.dumps(data, option=_ORJSON_OPTS))
+
+
+def _decode_output(value) -> Dict[str, Any]:
+    """Decode a stored stage output (compressed BLOB, or plain JSON TEXT from older databases)"""
+    if isinstance(value, bytes):
+        value = zstd.ZstdDecompressor().decompress(value)
+    return orjson.loads(value)
 
 
 def init_database() -> None:
-    """Initialize database with schema"""
+    """Initialize database with schema (connection pragmas, incl. WAL mode, are applied on connect)"""
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
     
     with get_connection() as conn:
@@ -52,7 +168,7 @@ def init_database() -> None:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 pipeline_id TEXT NOT NULL,
                 stage INTEGER NOT NULL,
-                output_json TEXT NOT NULL,
+                output_json BLOB NOT NULL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (pipeline_id) REFERENCES pipelines(id)
             )
@@ -72,7 +188,11 @@ def init_database() -> None:
         ''')
         
         # Create indexes
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_pipeline_status ON pipelines(status)')
+        # (status, updated_at) serves both filtered listings and plain status lookups,
+        # so it replaces the older status-only index
+        cursor.execute('DROP INDEX IF EXISTS idx_pipeline_status')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_pipelines_status_updated ON pipelines(status, updated_at DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_pipelines_updated ON pipelines(updated_at DESC)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_stage_outputs_pipeline ON stage_outputs(pipeline_id, stage)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_audit_log_pipeline ON audit_log(pipeline_id)')
         
@@ -108,23 +228,17 @@ def update_pipeline_status(
     quality_score: Optional[float] = None
 ) -> None:
     """Update pipeline status and optional fields"""
+    query = _UPDATE_STATUS_QUERIES[(safety_decision is not None, quality_score is not None)]
+    
+    params = [status]
+    if safety_decision is not None:
+        params.append(safety_decision)
+    if quality_score is not None:
+        params.append(quality_score)
+    params.append(pipeline_id)
+    
     with get_connection() as conn:
         cursor = conn.cursor()
-        
-        updates = ['status = ?', 'updated_at = CURRENT_TIMESTAMP']
-        params = [status]
-        
-        if safety_decision is not None:
-            updates.append('safety_decision = ?')
-            params.append(safety_decision)
-        
-        if quality_score is not None:
-            updates.append('quality_score = ?')
-            params.append(quality_score)
-        
-        params.append(pipeline_id)
-        
-        query = f"UPDATE pipelines SET {', '.join(updates)} WHERE id = ?"
         cursor.execute(query, params)
 
 
@@ -135,7 +249,20 @@ def save_stage_output(pipeline_id: str, stage: int, data: Dict[str, Any]) -> Non
         cursor.execute('''
             INSERT INTO stage_outputs (pipeline_id, stage, output_json)
             VALUES (?, ?, ?)
-        ''', (pipeline_id, stage, json.dumps(data)))
+        ''', (pipeline_id, stage, _encode_output(data)))
+
+
+def save_stage_outputs_bulk(rows: List[Tuple[str, int, Dict[str, Any]]]) -> None:
+    """Save several (pipeline_id, stage, data) stage outputs in a single transaction"""
+    if not rows:
+        return
+    
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany('''
+            INSERT INTO stage_outputs (pipeline_id, stage, output_json)
+            VALUES (?, ?, ?)
+        ''', [(pipeline_id, stage, _encode_output(data)) for pipeline_id, stage, data in rows])
 
 
 def get_stage_output(pipeline_id: str, stage: int) -> Optional[Dict[str, Any]]:
@@ -145,34 +272,35 @@ def get_stage_output(pipeline_id: str, stage: int) -> Optional[Dict[str, Any]]:
         cursor.execute('''
             SELECT output_json FROM stage_outputs
             WHERE pipeline_id = ? AND stage = ?
-            ORDER BY created_at DESC
+            ORDER BY created_at DESC, id DESC
             LIMIT 1
         ''', (pipeline_id, stage))
         
         row = cursor.fetchone()
         if row:
-            return json.loads(row['output_json'])
+            return _decode_output(row['output_json'])
         return None
 
 
 def get_all_stage_outputs(pipeline_id: str) -> Dict[int, Dict[str, Any]]:
-    """Retrieve all stage outputs for a pipeline"""
+    """Retrieve the most recent output of each stage for a pipeline"""
     with get_connection() as conn:
         cursor = conn.cursor()
+        # Rank rows per stage in SQL so superseded outputs are never fetched or decoded
         cursor.execute('''
-            SELECT stage, output_json FROM stage_outputs
-            WHERE pipeline_id = ?
-            ORDER BY stage, created_at DESC
+            SELECT stage, output_json FROM (
+                SELECT stage, output_json,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY stage ORDER BY created_at DESC, id DESC
+                       ) AS rank
+                FROM stage_outputs
+                WHERE pipeline_id = ?
+            )
+            WHERE rank = 1
+            ORDER BY stage
         ''', (pipeline_id,))
         
-        outputs = {}
-        for row in cursor.fetchall():
-            stage = row['stage']
-            # Only keep the most recent output for each stage
-            if stage not in outputs:
-                outputs[stage] = json.loads(row['output_json'])
-        
-        return outputs
+        return {row['stage']: _decode_output(row['output_json']) for row in cursor.fetchall()}
 
 
 def get_pipeline_state(pipeline_id: str) -> Optional[Dict[str, Any]]:
@@ -203,23 +331,49 @@ def log_audit_event(
     metadata: Optional[Dict[str, Any]] = None,
     reviewer: Optional[str] = None
 ) -> None:
-    """Log an audit event"""
+    """Log an audit event (buffered; reviewer decisions are written immediately)"""
+    # Same format (UTC, seconds) as SQLite's CURRENT_TIMESTAMP default
+    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    metadata_json = orjson.dumps(metadata, option=_ORJSON_OPTS).decode('utf-8') if metadata else None
+    
+    with _audit_lock:
+        _audit_buffer.append((pipeline_id, event_type, reviewer, metadata_json, timestamp))
+        should_flush = reviewer is not None or len(_audit_buffer) >= AUDIT_FLUSH_SIZE
+    
+    if should_flush:
+        flush_audit_log()
+
+
+def flush_audit_log() -> None:
+    """Write all buffered audit events in a single transaction"""
+    with _audit_lock:
+        if not _audit_buffer:
+            return
+        rows = _audit_buffer[:]
+        _audit_buffer.clear()
+    
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO audit_log (pipeline_id, event_type, reviewer, metadata)
-            VALUES (?, ?, ?, ?)
-        ''', (pipeline_id, event_type, reviewer, json.dumps(metadata) if metadata else None))
+        cursor.executemany('''
+            INSERT INTO audit_log (pipeline_id, event_type, reviewer, metadata, timestamp)
+            VALUES (?, ?, ?, ?, ?)
+        ''', rows)
+
+
+# Registered after close_connections() so pending events are written before it runs
+atexit.register(flush_audit_log)
 
 
 def get_audit_log(pipeline_id: str) -> List[Dict[str, Any]]:
     """Retrieve audit log for a pipeline"""
+    flush_audit_log()
+    
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT * FROM audit_log
             WHERE pipeline_id = ?
-            ORDER BY timestamp ASC
+            ORDER BY timestamp ASC, id ASC
         ''', (pipeline_id,))
         
         return [dict(row) for row in cursor.fetchall()]
@@ -231,15 +385,15 @@ def list_pipelines(status: Optional[str] = None, limit: int = 50) -> List[Dict[s
         cursor = conn.cursor()
         
         if status:
-            cursor.execute('''
-                SELECT * FROM pipelines
+            cursor.execute(f'''
+                SELECT {_PIPELINE_LIST_COLUMNS} FROM pipelines
                 WHERE status = ?
                 ORDER BY updated_at DESC
                 LIMIT ?
             ''', (status, limit))
         else:
-            cursor.execute('''
-                SELECT * FROM pipelines
+            cursor.execute(f'''
+                SELECT {_PIPELINE_LIST_COLUMNS} FROM pipelines
                 ORDER BY updated_at DESC
                 LIMIT ?
             ''', (limit,))
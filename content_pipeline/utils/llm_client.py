@@ -2,14 +2,119 @@
 LLM Client - Wrapper for Google Gemini API
 """
 import os
+import re
 import json
 import time
-from typing import Optional, Dict, Any
+import asyncio
+import weakref
+import threading
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Coroutine, TypeVar
 import google.generativeai as genai
 from dotenv import load_dotenv
 
 load_dotenv()
 
+T = TypeVar('T')
+
+# Maximum number of Gemini requests in flight at once on the async path
+MAX_CONCURRENT_REQUESTS = int(os.getenv('GEMINI_MAX_CONCURRENT_REQUESTS', '4'))
+
+# Request budget shared by every call path (sync, async and streaming)
+REQUESTS_PER_MINUTE = float(os.getenv('GEMINI_REQUESTS_PER_MINUTE', '60'))
+
+# Server-suggested retry delay in rate-limit errors, e.g. "retry in 12.5s"
+_RETRY_RE = re.compile(r'retry.*?(\d+\.?\d*)\s*s', re.IGNORECASE)
+
+# Markdown code fence lines wrapping a JSON reply
+_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$', re.MULTILINE | re.IGNORECASE)
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Start of the first JSON object or array in a reply
+_JSON_START_RE = re.compile(r'[{\[]')
+
+# One semaphore per event loop (asyncio primitives cannot be shared across loops)
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Get the concurrency-limiting semaphore for the running event loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+class _RateLimiter:
+    """Token bucket that hands out request slots; thread-safe and event-loop agnostic"""
+    
+    def __init__(self, requests_per_minute: float, burst: int):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        Take a request slot
+        
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Going negative books a future slot for this caller
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+_rate_limiter = _RateLimiter(REQUESTS_PER_MINUTE, burst=MAX_CONCURRENT_REQUESTS)
+
+# Long-lived event loop (on a daemon thread) that runs every async Gemini call made from
+# sync code. The SDK's grpc.aio channels are bound to the loop that created them, so a
+# fresh asyncio.run() per call would leave later calls on a channel whose loop is closed.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background event loop, starting it on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='gemini-event-loop', daemon=True).start()
+        return _loop
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the shared background event loop and wait for its result
+    
+    Args:
+        coro: Coroutine that makes async Gemini calls
+        
+    Returns:
+        The coroutine's result
+    """
+    loop = _get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_coroutine() cannot be called from the shared event loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
 class GeminiClient:
     """Client for interacting with Google Gemini API"""
     
@@ -23,6 +128,63 @@ class GeminiClient:
         # gemini-2.0-flash-exp has no free tier quota
         self.model = genai.GenerativeModel('gemini-2.0-flash')
         
+    def _build_request(
+        self,
+        prompt: str,
+        system: Optional[str],
+        temperature: float
+    ) -> Tuple[str, Any]:
+        """Build the combined prompt and generation config for a request"""
+        generation_config = genai.types.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=16000,  # Increased for longer articles (up to ~4000 words)
+        )
+        
+        # Combine system and user prompts
+        full_prompt = prompt
+        if system:
+            full_prompt = f"{system}\n\n{prompt}"
+        
+        return full_prompt, generation_config
+    
+    @staticmethod
+    def _retry_wait(error: Exception, attempt: int, max_retries: int) -> float:
+        """
+        Decide how long to wait before retrying a failed call
+        
+        Args:
+            error: Exception raised by the API call
+            attempt: Zero-based attempt number that failed
+            max_retries: Total number of attempts allowed
+            
+        Returns:
+            Seconds to wait before the next attempt
+            
+        Raises:
+            Exception: If no attempts remain
+        """
+        error_str = str(error)
+        # Check if it's a rate limit error
+        if "429" in error_str or "quota" in error_str.lower() or "rate" in error_str.lower():
+            # Extract retry delay if available
+            retry_match = _RETRY_RE.search(error_str)
+            if retry_match:
+                wait_time = float(retry_match.group(1)) + 5  # Add buffer
+            else:
+                wait_time = min(60 * (attempt + 1), 120)  # Max 2 minutes
+            
+            print(f"⚠ Rate limit hit. Waiting {wait_time:.1f} seconds...")
+            if attempt < max_retries - 1:
+                return wait_time
+            raise Exception(f"Rate limit exceeded. Please wait a few minutes and try again. Error: {error_str[:200]}")
+        
+        if attempt < max_retries - 1:
+            wait_time = min(2 ** attempt, 30)  # Exponential backoff, max 30s
+            print(f"API call failed (attempt {attempt + 1}/{max_retries}): {error_str[:200]}")
+            print(f"Retrying in {wait_time} seconds...")
+            return wait_time
+        raise Exception(f"Gemini API call failed after {max_retries} attempts: {error_str[:200]}")
+    
     def call_gemini(
         self, 
         prompt: str, 
@@ -42,6 +204,8 @@ class GeminiClient:
         Returns:
             Generated text response
         """
+        full_prompt, generation_config = self._build_request(prompt, system, temperature)
+        
         for attempt in range(max_retries):
             try:
                 # Add delay between attempts to respect rate limits
@@ -50,52 +214,136 @@ class GeminiClient:
                     print(f"Waiting {wait_time} seconds before retry...")
                     time.sleep(wait_time)
                 
-                generation_config = genai.types.GenerationConfig(
-                    temperature=temperature,
-                    max_output_tokens=16000,  # Increased for longer articles (up to ~4000 words)
-                )
-                
-                # Combine system and user prompts
-                full_prompt = prompt
-                if system:
-                    full_prompt = f"{system}\n\n{prompt}"
+                delay = _rate_limiter.reserve()
+                if delay:
+                    time.sleep(delay)
                 
                 response = self.model.generate_content(
                     full_prompt,
                     generation_config=generation_config
                 )
                 
-                # Small delay after successful call to respect rate limits
-                time.sleep(0.5)
-                
                 return response.text
                 
             except Exception as e:
-                error_str = str(e)
-                # Check if it's a rate limit error
-                if "429" in error_str or "quota" in error_str.lower() or "rate" in error_str.lower():
-                    # Extract retry delay if available
-                    import re
-                    retry_match = re.search(r'retry.*?(\d+\.?\d*)\s*s', error_str, re.IGNORECASE)
-                    if retry_match:
-                        wait_time = float(retry_match.group(1)) + 5  # Add buffer
-                    else:
-                        wait_time = min(60 * (attempt + 1), 120)  # Max 2 minutes
+                time.sleep(self._retry_wait(e, attempt, max_retries))
+    
+    async def acall_gemini(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_retries: int = 3
+    ) -> str:
+        """
+        Async variant of call_gemini, capped by the shared concurrency limit
+        
+        Args:
+            prompt: User prompt
+            system: System instructions
+            temperature: Generation temperature (0.0-1.0)
+            max_retries: Number of retries on failure
+            
+        Returns:
+            Generated text response
+        """
+        full_prompt, generation_config = self._build_request(prompt, system, temperature)
+        
+        async with _get_semaphore():
+            for attempt in range(max_retries):
+                try:
+                    if attempt > 0:
+                        wait_time = min(2 ** attempt, 60)  # Exponential backoff, max 60s
+                        print(f"Waiting {wait_time} seconds before retry...")
+                        await asyncio.sleep(wait_time)
                     
-                    print(f"⚠ Rate limit hit. Waiting {wait_time:.1f} seconds...")
-                    if attempt < max_retries - 1:
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        raise Exception(f"Rate limit exceeded. Please wait a few minutes and try again. Error: {error_str[:200]}")
-                
-                if attempt < max_retries - 1:
-                    wait_time = min(2 ** attempt, 30)  # Exponential backoff, max 30s
-                    print(f"API call failed (attempt {attempt + 1}/{max_retries}): {error_str[:200]}")
-                    print(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    raise Exception(f"Gemini API call failed after {max_retries} attempts: {error_str[:200]}")
+                    delay = _rate_limiter.reserve()
+                    if delay:
+                        await asyncio.sleep(delay)
+                    
+                    response = await self.model.generate_content_async(
+                        full_prompt,
+                        generation_config=generation_config
+                    )
+                    
+                    return response.text
+                    
+                except Exception as e:
+                    await asyncio.sleep(self._retry_wait(e, attempt, max_retries))
+    
+    async def acall_many(
+        self,
+        prompts: List[str],
+        system: Optional[str] = None,
+        temperature: float = 0.7
+    ) -> List[str]:
+        """
+        Run several independent prompts concurrently
+        
+        Args:
+            prompts: User prompts
+            system: System instructions shared by every prompt
+            temperature: Generation temperature (0.0-1.0)
+            
+        Returns:
+            Generated text responses, in prompt order
+        """
+        return await asyncio.gather(*(
+            self.acall_gemini(prompt, system, temperature)
+            for prompt in prompts
+        ))
+    
+    async def astream_gemini(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_retries: int = 3
+    ) -> AsyncIterator[str]:
+        """
+        Stream a Gemini response as text chunks while it is being generated
+        
+        Args:
+            prompt: User prompt
+            system: System instructions
+            temperature: Generation temperature (0.0-1.0)
+            max_retries: Number of retries on failure
+            
+        Yields:
+            Text chunks in generation order
+        """
+        full_prompt, generation_config = self._build_request(prompt, system, temperature)
+        
+        async with _get_semaphore():
+            for attempt in range(max_retries):
+                received = False
+                try:
+                    if attempt > 0:
+                        wait_time = min(2 ** attempt, 60)  # Exponential backoff, max 60s
+                        print(f"Waiting {wait_time} seconds before retry...")
+                        await asyncio.sleep(wait_time)
+                    
+                    delay = _rate_limiter.reserve()
+                    if delay:
+                        await asyncio.sleep(delay)
+                    
+                    response = await self.model.generate_content_async(
+                        full_prompt,
+                        generation_config=generation_config,
+                        stream=True
+                    )
+                    
+                    async for chunk in response:
+                        received = True
+                        yield chunk.text
+                    
+                    return
+                    
+                except Exception as e:
+                    # Chunks already handed to the caller cannot be taken back
+                    if received:
+                        raise
+                    await asyncio.sleep(self._retry_wait(e, attempt, max_retries))
     
     def call_with_structured_output(
         self, 
@@ -117,29 +365,30 @@ class GeminiClient:
         response_text = self.call_gemini(prompt, system, temperature)
         
         # Extract JSON from response (handle markdown code blocks)
-        json_text = response_text.strip()
-        
-        # Remove markdown code block markers if present
-        if json_text.startswith('```'):
-            lines = json_text.split('\n')
-            # Remove first line (```json or ```}
-            lines = lines[1:]
-            # Remove last line if it's just ```
-            if lines and lines[-1].strip() == '```':
-                lines = lines[:-1]
-            json_text = '\n'.join(lines)
+        json_text = _FENCE_RE.sub('', response_text).strip()
+        
+        # Decode the first JSON value, skipping leading prose, numbers or quoted strings
+        match = _JSON_START_RE.search(json_text)
+        if match is None:
+            raise ValueError(f"Failed to parse JSON from response: no JSON value found\nResponse: {response_text}")
         
         try:
-            return json.loads(json_text)
+            # Parses one complete value, ignoring any trailing prose
+            result = _JSON_DECODER.raw_decode(json_text, match.start())[0]
         except json.JSONDecodeError as e:
-            # Try to find JSON object in text
-            start_idx = json_text.find('{')
-            end_idx = json_text.rfind('}')
-            if start_idx != -1 and end_idx != -1:
-                json_text = json_text[start_idx:end_idx + 1]
-                return json.loads(json_text)
-            else:
+            # A bracket in leading prose (e.g. "[Draft] {...}") - fall back to the next object
+            start_idx = json_text.find('{', match.start() + 1)
+            if start_idx == -1:
                 raise ValueError(f"Failed to parse JSON from response: {e}\nResponse: {response_text}")
+            try:
+                result = _JSON_DECODER.raw_decode(json_text, start_idx)[0]
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Failed to parse JSON from response: {e}\nResponse: {response_text}")
+        
+        if not isinstance(result, dict):
+            raise ValueError(f"Expected a JSON object, got {type(result).__name__}\nResponse: {response_text}")
+        
+        return result
 
 
 # Global instance
@@ -159,6 +408,33 @@ def call_gemini(prompt: str, system: Optional[str] = None, temperature: float =
     return client.call_gemini(prompt, system, temperature)
 
 
+async def acall_gemini(prompt: str, system: Optional[str] = None, temperature: float = 0.7) -> str:
+    """Convenience function for calling Gemini asynchronously"""
+    client = get_client()
+    return await client.acall_gemini(prompt, system, temperature)
+
+
+def call_many(
+    prompts: List[str],
+    system: Optional[str] = None,
+    temperature: float = 0.7
+) -> List[str]:
+    """Convenience function for running several prompts concurrently from sync code"""
+    client = get_client()
+    return run_coroutine(client.acall_many(prompts, system, temperature))
+
+
+async def astream_gemini(
+    prompt: str,
+    system: Optional[str] = None,
+    temperature: float = 0.7
+) -> AsyncIterator[str]:
+    """Convenience function for streaming a Gemini response"""
+    client = get_client()
+    async for text in client.astream_gemini(prompt, system, temperature):
+        yield text
+
+
 def call_with_structured_output(
     prompt: str, 
     system: Optional[str] = None,
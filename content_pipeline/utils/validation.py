@@ -1,11 +1,152 @@
 """
 Validation Utilities - Content and HTML validation functions
 """
+import os
 import re
-from typing import Dict, Any, List, Tuple
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
-import textstat
-from bs4 import BeautifulSoup
+import numpy as np
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+try:
+    # Lexbor-backed read-only DOM; much faster than building a bs4 tree
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # Event-driven (SAX-style) HTML parsing for text extraction without building a tree
+    from lxml import etree
+    import lxml.html as lxml_html
+except ImportError:
+    etree = lxml_html = None
+
+
+def _pick_html_parser() -> str:
+    """Prefer the C-based lxml parser, falling back to the pure-Python one if it is missing"""
+    try:
+        BeautifulSoup('', 'lxml')
+        return 'lxml'
+    except FeatureNotFound:
+        return 'html.parser'
+
+
+# BeautifulSoup tree builder used throughout this module
+HTML_PARSER = _pick_html_parser()
+
+# Elements whose text is not part of the article body
+_SKIP_TEXT_TAGS = frozenset({'script', 'style', 'nav', 'footer', 'header'})
+
+# Any whitespace run, collapsed to a single space in extracted text
+_WS_RE = re.compile(r'\s+')
+
+# CSS selector for every heading level, in document order
+_HEADING_SELECTOR = 'h1,h2,h3,h4,h5,h6'
+
+# Start of an element tag; text without one is not treated as an HTML document
+_START_TAG_RE = re.compile(r'<[A-Za-z]')
+
+# Compiled XPath for every heading level; a union yields matches in document order
+_HEADING_XPATH = etree.XPath('//h1|//h2|//h3|//h4|//h5|//h6') if etree is not None else None
+
+# bs4 strainers so only the tags a function reads are built into the tree. They are
+# only used on the fallback paths taken when selectolax or lxml is not installed
+_HEADING_STRAINER = SoupStrainer(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Link classifier: group 1 = external (http/https), group 2 = skipped (mailto/tel);
+# anything else (paths, fragments, relative links) is internal
+_LINK_KIND = re.compile(r'(https?://)|(mailto:|tel:)')
+
+# Absolute http(s) URL with a non-empty host; the scheme is case-insensitive as in urlparse.
+# Fast path only - anything it rejects is re-checked with urlparse
+_URL_RE = re.compile(r'^https?://[^/?#\s]+', re.IGNORECASE)
+
+# Word token, as used for word counts and keyword density
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Sentence terminator run ("...", "?!" count once)
+_SENT_RE = re.compile(r'[.!?]+')
+
+# Vowel groups, each approximating one syllable
+_VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+
+# Optimal meta description length range (inclusive)
+META_DESCRIPTION_MIN_LENGTH = 150
+META_DESCRIPTION_MAX_LENGTH = 160
+
+# Upper bound on documents sent to a worker process per task by the *_batch helpers;
+# smaller batches use smaller chunks (about 4 per worker) so every worker gets work
+BATCH_CHUNKSIZE = 16
+
+# Common Sendmarc topics (lowercase keyword -> internal page)
+INTERNAL_LINK_TOPICS = {
+    'dmarc': 'DMARC Guide',
+    'spf': 'SPF Configuration',
+    'dkim': 'DKIM Setup',
+    'email authentication': 'Email Authentication',
+    'phishing': 'Phishing Prevention',
+    'domain spoofing': 'Domain Spoofing Protection',
+    'email security': 'Email Security Best Practices',
+    'dmarc policy': 'DMARC Policy Configuration',
+    'dmarc report': 'DMARC Reporting',
+    'email deliverability': 'Email Deliverability'
+}
+
+# Single-pass scan for every topic keyword. The lookahead reports a match at each
+# position (so overlapping keywords are all seen) and longest-first alternation
+# picks the longest keyword there. Each keyword has its own named group, so the match
+# is identified by match.lastgroup rather than by lowercasing the matched text (under
+# IGNORECASE, 'ſ' matches 's' and 'İ' matches 'i', but they do not lowercase to them).
+# _TOPIC_PAGES maps the group to the pages of every topic keyword that prefixes it, so
+# shorter keywords at the same position are not lost. The pages are held as dict keys
+# so they can be merged into an ordered dedupe directly.
+_TOPIC_KEYWORDS = sorted(INTERNAL_LINK_TOPICS, key=len, reverse=True)
+_TOPIC_RE = re.compile(
+    '(?=' + '|'.join(f'(?P<t{i}>{re.escape(k)})' for i, k in enumerate(_TOPIC_KEYWORDS)) + ')',
+    re.IGNORECASE
+)
+_TOPIC_PAGES = {
+    f't{i}': dict.fromkeys(page for k, page in INTERNAL_LINK_TOPICS.items() if keyword.startswith(k))
+    for i, keyword in enumerate(_TOPIC_KEYWORDS)
+}
+
+# Markdown ATX heading: 1-6 leading '#' followed by non-empty text, minus any closing '#'s
+_HEADING_RE = re.compile(r'^[^\S\n]*(#{1,6})(?!#)[^\S\n]*(\S.*?)(?:[^\S\n]+#+)?[^\S\n]*$', re.MULTILINE)
+
+
+@lru_cache(maxsize=32)
+def _heading_levels(html: str) -> Optional[Tuple[int, ...]]:
+    """
+    Collect heading levels in document order with a single tree walk (memoized per input)
+    
+    Args:
+        html: HTML content
+        
+    Returns:
+        Tuple of heading levels (1-6), or None if the document has no elements
+    """
+    # Both parsers wrap bare text in an implied element; only markup in the source counts
+    if not _START_TAG_RE.search(html):
+        return None
+    
+    if lxml_html is not None:
+        try:
+            try:
+                root = lxml_html.fromstring(html)
+            except ValueError:
+                # str input with an XML encoding declaration is refused; parse the bytes
+                root = lxml_html.fromstring(html.encode('utf-8'))
+        except etree.ParserError:
+            # Raised for empty, whitespace-only or comment-only documents
+            return None
+        return tuple(int(h.tag[1]) for h in _HEADING_XPATH(root))
+    
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_HEADING_STRAINER)
+    return tuple(int(h.name[1]) for h in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']))
 
 
 def validate_url(url: str) -> bool:
@@ -18,6 +159,9 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    if isinstance(url, str) and _URL_RE.match(url.strip()):
+        return True
+    
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc]) and result.scheme in ['http', 'https']
@@ -38,26 +182,25 @@ def validate_html(html: str) -> Tuple[bool, List[str]]:
     issues = []
     
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        levels = _heading_levels(html)
         
         # Check for basic structure
-        if not soup.find():
+        if levels is None:
             issues.append("Empty or invalid HTML")
             return False, issues
         
         # Check heading hierarchy
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        if not headings:
+        if not levels:
             issues.append("No headings found")
         
-        h1_count = len(soup.find_all('h1'))
+        h1_count = levels.count(1)
         if h1_count == 0:
             issues.append("Missing H1 tag")
         elif h1_count > 1:
             issues.append(f"Multiple H1 tags found ({h1_count})")
         
-        # Check for broken hierarchy
-        if not validate_heading_hierarchy(html):
+        # Check for broken hierarchy (reuses the levels above; no second lookup or parse)
+        if not _check_levels(levels):
             issues.append("Broken heading hierarchy (headings skip levels)")
         
         return len(issues) == 0, issues
@@ -77,30 +220,56 @@ def validate_heading_hierarchy(html: str) -> bool:
     Returns:
         True if hierarchy is valid
     """
-    soup = BeautifulSoup(html, 'html.parser')
-    headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+    return _check_levels(_heading_levels(html) or ())
+
+
+def _check_levels(found: Sequence[int]) -> bool:
+    """
+    Check heading levels in document order for a valid hierarchy
     
-    if not headings:
-        return False
+    Args:
+        found: Heading levels (1-6) as they appear in the document
+        
+    Returns:
+        True if the first heading is H1 and no heading skips a level
+    """
+    levels = np.fromiter(found, dtype=np.int8)
     
-    levels = [int(h.name[1]) for h in headings]
+    if levels.size == 0:
+        return False
     
     # First heading should be H1
     if levels[0] != 1:
         return False
     
-    # Check for skipped levels
-    for i in range(1, len(levels)):
-        if levels[i] > levels[i-1] + 1:
-            return False
+    # Check for skipped levels (a heading may go at most one level deeper than the last)
+    return levels.size == 1 or bool(np.diff(levels).max() <= 1)
+
+
+@lru_cache(maxsize=100_000)
+def _syllables(word: str) -> int:
+    """
+    Estimate the syllables in a word by counting vowel groups (memoized; prose repeats words)
     
-    return True
+    Args:
+        word: Lowercase word (lowercased by the caller so case variants share a cache entry)
+        
+    Returns:
+        Syllable count (at least 1)
+    """
+    count = len(_VOWEL_GROUP_RE.findall(word))
+    # Silent trailing 'e' ("make"), but not "-le" ("table")
+    if count > 1 and word.endswith('e') and not word.endswith('le'):
+        count -= 1
+    return max(count, 1)
 
 
 def calculate_readability(text: str) -> Dict[str, float]:
     """
     Calculate readability scores
     
+    Words, sentences and syllables are counted once and shared by both Flesch formulas.
+    
     Args:
         text: Text content to analyze
         
@@ -119,18 +288,23 @@ def calculate_readability(text: str) -> Dict[str, float]:
         }
     
     try:
-        # Calculate average sentence length manually if needed
-        sentences = text.split('.')
-        avg_sentence_length = len(text.split()) / max(len([s for s in sentences if s.strip()]), 1)
+        words = _WORD_RE.findall(text)
+        n_words = max(len(words), 1)
+        n_sentences = max(len(_SENT_RE.findall(text)), 1)
+        n_syllables = sum(_syllables(word.lower()) for word in words)
         
-        # Calculate average word length manually
-        words = text.split()
-        avg_word_length = sum(len(word) for word in words) / max(len(words), 1) if words else 0
+        words_per_sentence = n_words / n_sentences
+        syllables_per_word = n_syllables / n_words
+        
+        # Whitespace is already normalized to single spaces, so the non-space characters
+        # over the space-separated token count is the average token length
+        n_spaces = text.count(' ')
+        avg_word_length = (len(text) - n_spaces) / (n_spaces + 1)
         
         return {
-            'flesch_reading_ease': textstat.flesch_reading_ease(text),
-            'flesch_kincaid_grade': textstat.flesch_kincaid_grade(text),
-            'avg_sentence_length': avg_sentence_length,
+            'flesch_reading_ease': 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word,
+            'flesch_kincaid_grade': 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59,
+            'avg_sentence_length': words_per_sentence,
             'avg_word_length': avg_word_length
         }
     except Exception as e:
@@ -143,33 +317,147 @@ def calculate_readability(text: str) -> Dict[str, float]:
         }
 
 
-def check_keyword_density(text: str, keyword: str) -> float:
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into word tokens
+    
+    Args:
+        text: Text content
+        
+    Returns:
+        List of words (tokenize once and pass to the helpers below to avoid re-scanning)
+    """
+    return _WORD_RE.findall(text)
+
+
+def check_keyword_density(text: str, keyword: str, words: Optional[List[str]] = None) -> float:
     """
     Calculate keyword density percentage
     
     Args:
         text: Text content
-        keyword: Keyword to check
+        keyword: Keyword to check (matched case-insensitively as whole words)
+        words: Pre-tokenized words of text (from tokenize), counted here if omitted
         
     Returns:
         Density as decimal (0.015 = 1.5%)
     """
-    text_lower = text.lower()
-    keyword_lower = keyword.lower()
-    
     # Count total words
-    words = re.findall(r'\b\w+\b', text_lower)
-    total_words = len(words)
+    if words is None:
+        total_words = sum(1 for _ in _WORD_RE.finditer(text))
+    else:
+        total_words = len(words)
     
-    if total_words == 0:
+    if total_words == 0 or not keyword:
         return 0.0
     
-    # Count keyword occurrences
-    keyword_count = text_lower.count(keyword_lower)
+    # Count keyword occurrences without copying the text to lowercase. Lookarounds rather
+    # than \b so keywords that start or end with punctuation ("C++") still match
+    pattern = re.compile(r'(?<!\w)' + re.escape(keyword) + r'(?!\w)', re.IGNORECASE)
+    keyword_count = sum(1 for _ in pattern.finditer(text))
     
     return keyword_count / total_words
 
 
+@lru_cache(maxsize=64)
+def _keyword_scanner(keywords: Tuple[str, ...]) -> Tuple["re.Pattern[str]", Dict[str, List[str]]]:
+    """
+    Compile a single-pass, case-insensitive scanner for a set of keywords
+    
+    Args:
+        keywords: Distinct non-empty keywords
+        
+    Returns:
+        Tuple of (lookahead alternation pattern, matched group name -> keywords it accounts for)
+    """
+    # One named group per keyword: the match is identified by match.lastgroup, as
+    # lowercasing the matched text does not undo IGNORECASE folds such as 'ſ' -> 's'
+    ordered = sorted(keywords, key=len, reverse=True)
+    pattern = re.compile(
+        r'(?=(?<!\w)(?:' + '|'.join(f'(?P<k{i}>{re.escape(k)})' for i, k in enumerate(ordered)) + r')(?!\w))',
+        re.IGNORECASE
+    )
+    # A keyword also occurs wherever the matched one does if it matches (under the same
+    # case folding) a prefix of it that is followed by a non-word character or the end;
+    # this covers shorter keywords and case-fold twins such as 'ſ' and 's'
+    prefixes = {
+        f'k{i}': [
+            k for k in keywords
+            if re.match(re.escape(k) + r'(?!\w)', keyword, re.IGNORECASE)
+        ]
+        for i, keyword in enumerate(ordered)
+    }
+    return pattern, prefixes
+
+
+def check_keyword_density_batch(
+    text: str,
+    keywords: List[str],
+    words: Optional[List[str]] = None
+) -> Dict[str, float]:
+    """
+    Calculate keyword density for several keywords in one pass over the text
+    
+    Args:
+        text: Text content
+        keywords: Keywords to check (matched case-insensitively as whole words)
+        words: Pre-tokenized words of text (from tokenize), counted here if omitted
+        
+    Returns:
+        Dictionary mapping each keyword to its density as decimal
+    """
+    if words is None:
+        total_words = sum(1 for _ in _WORD_RE.finditer(text))
+    else:
+        total_words = len(words)
+    
+    # Kept as given rather than lowercased: str.lower() can change a keyword's length
+    # ('İ' lowercases to two characters), and the scanner credits case variants together
+    distinct = tuple(sorted({keyword for keyword in keywords if keyword}))
+    if total_words == 0 or not distinct:
+        return {keyword: 0.0 for keyword in keywords}
+    
+    # Same idea as _TOPIC_RE: one match per position, crediting shorter keywords
+    # that prefix the longest one found there. Each keyword only counts matches that
+    # start after its previous one ends, as finditer does in check_keyword_density
+    pattern, prefixes = _keyword_scanner(distinct)
+    counts = Counter()
+    next_start: Dict[str, int] = {}
+    for match in pattern.finditer(text):
+        start = match.start()
+        for keyword in prefixes[match.lastgroup]:
+            if start >= next_start.get(keyword, 0):
+                counts[keyword] += 1
+                next_start[keyword] = start + len(keyword)
+    
+    return {keyword: counts[keyword] / total_words for keyword in keywords}
+
+
+class _TextCollector:
+    """lxml parser target that gathers text in document order, skipping _SKIP_TEXT_TAGS subtrees"""
+    
+    def __init__(self):
+        self.parts = []
+        self.skip_depth = 0
+    
+    def start(self, tag, attrib):
+        if self.skip_depth:
+            self.skip_depth += 1
+        elif tag in _SKIP_TEXT_TAGS:
+            self.skip_depth = 1
+    
+    def end(self, tag):
+        if self.skip_depth:
+            self.skip_depth -= 1
+    
+    def data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+    
+    def close(self) -> str:
+        return ''.join(self.parts)
+
+
 def extract_text_from_html(html: str) -> str:
     """
     Extract plain text from HTML
@@ -180,33 +468,35 @@ def extract_text_from_html(html: str) -> str:
     Returns:
         Plain text content
     """
-    soup = BeautifulSoup(html, 'html.parser')
+    if etree is not None:
+        # Stream parser events straight into the collector; no tree is built
+        parser = etree.HTMLParser(target=_TextCollector())
+        parser.feed(html)
+        return _WS_RE.sub(' ', parser.close()).strip()
+    
+    soup = BeautifulSoup(html, HTML_PARSER)
     
     # Remove script and style elements
     for script in soup(['script', 'style', 'nav', 'footer', 'header']):
         script.decompose()
     
-    text = soup.get_text()
-    
     # Clean up whitespace
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = ' '.join(chunk for chunk in chunks if chunk)
-    
-    return text
+    return _WS_RE.sub(' ', soup.get_text()).strip()
 
 
-def count_words(text: str) -> int:
+def count_words(text: str, words: Optional[List[str]] = None) -> int:
     """
     Count words in text
     
     Args:
         text: Text content
+        words: Pre-tokenized words of text (from tokenize), computed if omitted
         
     Returns:
         Word count
     """
-    words = re.findall(r'\b\w+\b', text)
+    if words is None:
+        words = tokenize(text)
     return len(words)
 
 
@@ -229,30 +519,21 @@ def extract_headings(content: str) -> Dict[str, List[str]]:
         'h6': []
     }
     
-    # First, try to extract Markdown headings (# syntax)
-    lines = content.split('\n')
-    for line in lines:
-        line = line.strip()
-        if line.startswith('#'):
-            # Count the number of # symbols
-            level = 0
-            for char in line:
-                if char == '#':
-                    level += 1
-                else:
-                    break
-            
-            if 1 <= level <= 6:
-                # Extract heading text (remove # and leading/trailing whitespace)
-                heading_text = line[level:].strip()
-                if heading_text:
-                    headings[f'h{level}'].append(heading_text)
+    # First, try to extract Markdown headings (# syntax) in a single regex pass
+    found = False
+    for match in _HEADING_RE.finditer(content):
+        headings[f'h{len(match.group(1))}'].append(match.group(2))
+        found = True
     
     # If no Markdown headings found, try HTML
-    if all(len(h) == 0 for h in headings.values()):
-        soup = BeautifulSoup(content, 'html.parser')
-        for level in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            headings[level] = [h.get_text().strip() for h in soup.find_all(level)]
+    if not found:
+        if LexborHTMLParser is not None:
+            for node in LexborHTMLParser(content).css(_HEADING_SELECTOR):
+                headings[node.tag].append(node.text().strip())
+        else:
+            soup = BeautifulSoup(content, HTML_PARSER, parse_only=_HEADING_STRAINER)
+            for level in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+                headings[level] = [h.get_text().strip() for h in soup.find_all(level)]
     
     return headings
 
@@ -267,28 +548,28 @@ def find_internal_link_opportunities(text: str) -> List[str]:
     Returns:
         List of suggested topics/pages for internal linking
     """
-    text_lower = text.lower()
-    
-    # Common Sendmarc topics
-    topics = {
-        'dmarc': 'DMARC Guide',
-        'spf': 'SPF Configuration',
-        'dkim': 'DKIM Setup',
-        'email authentication': 'Email Authentication',
-        'phishing': 'Phishing Prevention',
-        'domain spoofing': 'Domain Spoofing Protection',
-        'email security': 'Email Security Best Practices',
-        'dmarc policy': 'DMARC Policy Configuration',
-        'dmarc report': 'DMARC Reporting',
-        'email deliverability': 'Email Deliverability'
-    }
-    
-    opportunities = []
-    for keyword, page_name in topics.items():
-        if keyword in text_lower:
-            opportunities.append(page_name)
+    # Pages are deduplicated as they are found, in order of first mention
+    opportunities = {}
+    # Case-insensitive scan: only the short matched keyword is lowercased, not the text
+    for match in _TOPIC_RE.finditer(text):
+        opportunities.update(_TOPIC_PAGES[match.lastgroup])
+        if len(opportunities) == len(INTERNAL_LINK_TOPICS):
+            break
+    
+    return list(opportunities)
+
+
+def is_meta_description_valid(description: str) -> bool:
+    """
+    Check meta description length without building a message
     
-    return list(set(opportunities))  # Remove duplicates
+    Args:
+        description: Meta description text
+        
+    Returns:
+        True if the length is within the optimal range
+    """
+    return META_DESCRIPTION_MIN_LENGTH <= len(description) <= META_DESCRIPTION_MAX_LENGTH
 
 
 def validate_meta_description(description: str) -> Tuple[bool, str]:
@@ -303,12 +584,11 @@ def validate_meta_description(description: str) -> Tuple[bool, str]:
     """
     length = len(description)
     
-    if length < 150:
-        return False, f"Meta description too short ({length} chars, minimum 150)"
-    elif length > 160:
-        return False, f"Meta description too long ({length} chars, maximum 160)"
-    else:
-        return True, f"Meta description length optimal ({length} chars)"
+    if length < META_DESCRIPTION_MIN_LENGTH:
+        return False, f"Meta description too short ({length} chars, minimum {META_DESCRIPTION_MIN_LENGTH})"
+    if length > META_DESCRIPTION_MAX_LENGTH:
+        return False, f"Meta description too long ({length} chars, maximum {META_DESCRIPTION_MAX_LENGTH})"
+    return True, f"Meta description length optimal ({length} chars)"
 
 
 def extract_links(html: str) -> Dict[str, List[str]]:
@@ -321,18 +601,104 @@ def extract_links(html: str) -> Dict[str, List[str]]:
     Returns:
         Dictionary with 'internal' and 'external' link lists
     """
-    soup = BeautifulSoup(html, 'html.parser')
     links = {
         'internal': [],
         'external': []
     }
     
-    for link in soup.find_all('a', href=True):
-        href = link['href']
-        if href.startswith(('http://', 'https://')):
-            links['external'].append(href)
-        elif href.startswith(('/', '#')) or not href.startswith(('mailto:', 'tel:')):
-            links['internal'].append(href)
+    if LexborHTMLParser is not None:
+        hrefs = [node.attributes.get('href') or '' for node in LexborHTMLParser(html).css('a[href]')]
+    else:
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=_LINK_STRAINER)
+        hrefs = [link['href'] for link in soup.find_all('a', href=True)]
+    
+    add_internal = links['internal'].append
+    add_external = links['external'].append
+    for href in hrefs:
+        kind = _LINK_KIND.match(href)
+        if kind is None:
+            add_internal(href)
+        elif kind.lastindex == 1:
+            add_external(href)
     
     return links
 
+
+def _map_in_processes(func: Callable, items: List[Any], workers: Optional[int]) -> List[Any]:
+    """
+    Apply a module-level function to each item across worker processes, keeping order
+    
+    Args:
+        func: Picklable (module-level) function taking one item
+        items: Inputs, e.g. one HTML or text document each
+        workers: Process count (None = one per CPU, never more than len(items));
+            1 runs in this process
+        
+    Returns:
+        List of results in the same order as items
+    """
+    items = list(items)
+    workers = min(workers or os.cpu_count() or 1, len(items))
+    if workers <= 1:
+        # Not worth starting a pool
+        return [func(item) for item in items]
+    
+    chunksize = max(1, min(BATCH_CHUNKSIZE, len(items) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items, chunksize=chunksize))
+
+
+def validate_html_batch(htmls: List[str], workers: Optional[int] = None) -> List[Tuple[bool, List[str]]]:
+    """
+    Validate many HTML documents in parallel (see validate_html)
+    
+    Args:
+        htmls: HTML documents to validate
+        workers: Process count (None = one per CPU)
+        
+    Returns:
+        List of (is_valid, list_of_issues) tuples, in input order
+    """
+    return _map_in_processes(validate_html, htmls, workers)
+
+
+def extract_headings_batch(contents: List[str], workers: Optional[int] = None) -> List[Dict[str, List[str]]]:
+    """
+    Extract headings from many documents in parallel (see extract_headings)
+    
+    Args:
+        contents: Markdown or HTML documents
+        workers: Process count (None = one per CPU)
+        
+    Returns:
+        List of heading dictionaries, in input order
+    """
+    return _map_in_processes(extract_headings, contents, workers)
+
+
+def extract_links_batch(htmls: List[str], workers: Optional[int] = None) -> List[Dict[str, List[str]]]:
+    """
+    Extract links from many HTML documents in parallel (see extract_links)
+    
+    Args:
+        htmls: HTML documents
+        workers: Process count (None = one per CPU)
+        
+    Returns:
+        List of link dictionaries, in input order
+    """
+    return _map_in_processes(extract_links, htmls, workers)
+
+
+def calculate_readability_batch(texts: List[str], workers: Optional[int] = None) -> List[Dict[str, float]]:
+    """
+    Calculate readability metrics for many texts in parallel (see calculate_readability)
+    
+    Args:
+        texts: Text documents
+        workers: Process count (None = one per CPU)
+        
+    Returns:
+        List of readability dictionaries, in input order
+    """
+    return _map_in_processes(calculate_readability, texts, workers)